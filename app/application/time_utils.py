@@ -4,7 +4,9 @@ Time utilities shared across presentation and application layers.
 
 from __future__ import annotations
 
+import time
 from datetime import datetime, timezone, timedelta
+from typing import Tuple
 
 # Costa Rica timezone (UTC-6)
 CR_TZ = timezone(timedelta(hours=-6))
@@ -12,6 +14,10 @@ CR_TZ = timezone(timedelta(hours=-6))
 VERSION = "2.0.0"
 APP_NAME = "OBD-II Scanner"
 
+# (epoch second, formatted) for cr_timestamp(); the format has 1 s resolution,
+# so strftime only needs to run once per second even at high sample rates.
+_cached_ts: Tuple[int, str] = (-1, "")
+
 
 def cr_now() -> datetime:
     """Get current time in Costa Rica timezone."""
@@ -20,7 +26,14 @@ def cr_now() -> datetime:
 
 def cr_timestamp() -> str:
     """Get formatted timestamp string."""
-    return cr_now().strftime("%Y-%m-%d %H:%M:%S")
+    global _cached_ts
+    sec = int(time.time())
+    cached = _cached_ts
+    if cached[0] == sec:
+        return cached[1]
+    text = datetime.fromtimestamp(sec, CR_TZ).strftime("%Y-%m-%d %H:%M:%S")
+    _cached_ts = (sec, text)
+    return text
 
 
 def cr_timestamp_filename() -> str:
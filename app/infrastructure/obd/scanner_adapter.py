@@ -8,7 +8,8 @@ from obd.obd2.base import NotConnectedError as OBDNotConnectedError
 from obd.obd2.base import ScannerError as OBDScannerError
 from obd.kline.adapter import KLineAdapter
 from obd.kline.session import KLineSession
-from obd.kline.profiles import ISO9141_2, KWP2000_5BAUD, KWP2000_FAST, td5_candidates
+from obd.kline.profiles import ISO9141_2, KWP2000_5BAUD, KWP2000_FAST, prefer_family, td5_candidates
+from obd.kline.config.detect import last_detected_family
 from obd.kline.config.errors import KLineDetectError, KLineError as OBDKLineError
 
 from app.domain.ports import (
@@ -204,9 +205,11 @@ class KLineScannerFactoryImpl(KLineScannerFactory):
         except Exception as exc:
             return None, None, exc
 
-        candidates = [KWP2000_5BAUD, KWP2000_FAST, ISO9141_2]
+        # Try the family that worked last time first (skips slow 5-baud init when it lost)
+        preferred = last_detected_family()
+        candidates = prefer_family([KWP2000_5BAUD, KWP2000_FAST, ISO9141_2], preferred)
         if manufacturer == "landrover":
-            candidates = candidates + td5_candidates()
+            candidates = candidates + td5_candidates(preferred=preferred)
 
         try:
             session = KLineSession.auto(elm, candidates=candidates)
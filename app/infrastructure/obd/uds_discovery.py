@@ -5,7 +5,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from obd.elm import ELM327, CommunicationError, DeviceDisconnectedError
-from obd.protocol import group_by_ecu, merge_payloads
+from obd.protocol import parse_and_merge
 from obd.protocol.isotp import strip_isotp_pci_from_payload
 from obd.protocol.ascii import extract_ascii_from_hex_tokens, is_valid_vin
 
@@ -82,9 +82,7 @@ def _send_probe(
         silence_timeout=0.05,
         min_wait_before_silence_break=max(0.05, timeout_s * 0.5),
     )
-    grouped = group_by_ecu(lines, headers_on=True)
-    merged = merge_payloads(grouped, headers_on=True)
-    return merged
+    return parse_and_merge(lines, headers_on=True)
 
 
 def _match_response(payload: List[str], request_sid: int) -> bool:
@@ -47,3 +47,11 @@ def vin_cache_path() -> Path:
 
 def settings_path() -> Path:
     return data_dir() / "cli_settings.json"
+
+
+def last_port_path() -> Path:
+    return data_dir() / "last_port.txt"
+
+
+def last_kline_family_path() -> Path:
+    return data_dir() / "last_kline_family.txt"
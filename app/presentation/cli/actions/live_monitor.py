@@ -27,11 +27,11 @@ def live_monitor(state: AppState) -> None:
     original_sigint = signal.getsignal(signal.SIGINT)
     signal.signal(signal.SIGINT, lambda sig, frame: _signal_handler(sig, frame, state))
 
+    logger = None
     try:
         print(f"\n  📊 {t('live_telemetry')}")
         log_choice = input(f"  {t('save_log_prompt')} (y/n): ").strip().lower()
 
-        logger = None
         if log_choice in ["y", "s"]:
             logger = get_container().telemetry_log.create_logger()
             log_file = logger.start_session(format=state.log_format)
@@ -94,3 +94,6 @@ def live_monitor(state: AppState) -> None:
             print(f"   {t('readings')}: {summary.get('reading_count', 0)}")
     finally:
         signal.signal(signal.SIGINT, original_sigint)
+        if logger:
+            # No-op after a normal end; otherwise keeps the rows already logged
+            logger.end_session()
@@ -1,13 +1,45 @@
 from __future__ import annotations
 
 import csv
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Mapping, Optional, List, Dict
 
 from .models import DTCInfo
 from .paths import data_dir
 
 
+@lru_cache(maxsize=32)
+def _parse_csv(path: str, mtime_ns: int, source: str) -> Mapping[str, DTCInfo]:
+    """
+    Parse one DTC CSV once per (file, mtime, source) and share the result
+    across every DTCDatabase (scanners, reconnects, set_manufacturer).
+    Callers copy it with dict.update(); DTCInfo is frozen.
+    """
+    codes: Dict[str, DTCInfo] = {}
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            try:
+                row = next(csv.reader([line]))
+            except Exception:
+                continue
+
+            if len(row) < 2:
+                continue
+
+            code = row[0].strip().upper()
+            desc = row[1].strip()
+            if not code:
+                continue
+
+            codes[code] = DTCInfo(code=code, description=desc, source=source)
+    return codes
+
+
 class DTCDatabase:
     MANUFACTURER_FILES = {
         "chrysler": "dtc_jeep_dodge_chrysler.csv",
@@ -22,9 +54,13 @@ class DTCDatabase:
         self.codes: Dict[str, DTCInfo] = {}
         self.manufacturer = manufacturer
         self._loaded_files: List[str] = []
+        # code as passed by the caller -> description (read_dtcs repeats codes
+        # across stored/pending/permanent and across scans)
+        self._desc_cache: Dict[str, str] = {}
         self._load_databases()
 
     def _load_databases(self) -> None:
+        self._desc_cache.clear()
         dd = data_dir()
         if not dd.exists():
             return
@@ -52,31 +88,13 @@ class DTCDatabase:
 
     def _load_from_csv(self, csv_path: Path, source: str) -> None:
         try:
-            with csv_path.open("r", encoding="utf-8-sig", newline="") as f:
-                self._loaded_files.append(csv_path.name)
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#"):
-                        continue
-
-                    try:
-                        row = next(csv.reader([line]))
-                    except Exception:
-                        continue
-
-                    if len(row) < 2:
-                        continue
-
-                    code = row[0].strip().upper()
-                    desc = row[1].strip()
-                    if not code:
-                        continue
-
-                    self.codes[code] = DTCInfo(code=code, description=desc, source=source)
-
+            codes = _parse_csv(str(csv_path), csv_path.stat().st_mtime_ns, source)
         except (OSError, IOError) as e:
             # No loggers aquí; dejar eso al caller si quiere
             print(f"Warning: Could not load {csv_path}: {e}")
+            return
+        self._loaded_files.append(csv_path.name)
+        self.codes.update(codes)
 
     def set_manufacturer(self, manufacturer: str) -> None:
         self.manufacturer = manufacturer
@@ -90,8 +108,12 @@ class DTCDatabase:
         return self.codes.get(code.strip().upper())
 
     def get_description(self, code: str) -> str:
-        info = self.lookup(code)
-        return info.description if info else "Unknown code - not in database"
+        desc = self._desc_cache.get(code)
+        if desc is None:
+            info = self.lookup(code)
+            desc = info.description if info else "Unknown code - not in database"
+            self._desc_cache[code] = desc
+        return desc
 
     def search(self, query: str) -> List[DTCInfo]:
         if not query:
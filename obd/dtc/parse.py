@@ -2,18 +2,22 @@ from typing import List
 from .decode import decode_dtc_bytes
 
 
+# Positive-response header per DTC mode (03/07/0A -> 43/47/4A)
+_MODE_PREFIXES = {"03": "43", "07": "47", "0A": "4A"}
+
+
 def parse_dtc_response(response: str, mode: str = "03") -> List[str]:
     dtcs: List[str] = []
     if not response:
         return dtcs
 
-    prefixes = {"03": "43", "07": "47", "0A": "4A"}
-    prefix = prefixes.get(mode, "43")
+    prefix = _MODE_PREFIXES.get(mode, "43")
 
     resp = response.replace(" ", "").upper()
 
-    if prefix in resp:
-        resp = resp.replace(prefix, "", 1)
+    # The header leads the payload; a "43" inside a DTC must not be cut out
+    if resp.startswith(prefix):
+        resp = resp[2:]
 
     for i in range(0, len(resp), 4):
         chunk = resp[i : i + 4]
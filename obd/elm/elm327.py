@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+import threading
 import time
 from typing import Optional, List, Callable, Any
 
@@ -11,6 +12,30 @@ from .ports import find_ports
 from .init import initialize_elm
 from .protocol import negotiate_protocol as _negotiate_protocol, get_protocol as _get_protocol
 
+# Vehicle-link failures in a 0100 reply (one scan instead of four substring checks)
+_LINK_ERROR_RE = re.compile(r"NO DATA|UNABLE TO CONNECT|CAN ERROR|STOPPED")
+# A reply line that starts with a CAN/J1850 header (headers on)
+_HEADER_LINE_RE = re.compile(r"^[0-9A-F]{3,8}\s")
+# Everything send_obd() drops from an upper-cased reply (bytes.translate delete table)
+_NON_HEX_BYTES = bytes(b for b in range(256) if b not in b"0123456789ABCDEF")
+# Upper-case the receive buffer and drop the prompt and non-ASCII noise in one
+# bytes.translate pass (no utf-8 decode while polling)
+_RX_UPPER = bytes.maketrans(b"abcdefghijklmnopqrstuvwxyz", b"ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+_RX_DROP = b">" + bytes(range(0x80, 0x100))
+
+
+def _has_meaningful_line(buf: bytes) -> bool:
+    """True once buf holds a line other than SEARCHING... or a clean BUS INIT."""
+    for ln in buf.translate(_RX_UPPER, _RX_DROP).replace(b"\r", b"\n").split(b"\n"):
+        up = ln.strip()
+        if not up:
+            continue
+        if up.startswith(b"SEARCHING"):
+            continue
+        if up.startswith(b"BUS INIT") and b"ERROR" not in up:
+            continue
+        return True
+    return False
 
 class ELM327:
     BAUD_RATES = [38400, 9600, 115200, 57600, 19200]
@@ -36,10 +61,16 @@ class ELM327:
         self.last_error: Optional[str] = None
         self.last_duration_s: Optional[float] = None
         self.last_raw_text: Optional[str] = None
+        # True when the last exchange ended on the '>' prompt (adapter idle)
+        self.last_prompt_seen = False
 
         # Default headers ON for robust multi-ECU parsing
         self.headers_on = True
 
+        # One command/response exchange at a time on the serial link, so
+        # callers on worker threads can overlap their own parsing safely.
+        self._io_lock = threading.RLock()
+
     @property
     def is_connected(self) -> bool:
         if not self._is_connected:
@@ -138,15 +169,34 @@ class ELM327:
         - Primary termination: '>' prompt
         - Secondary: silence break AFTER min_wait_before_silence_break
         """
+        with self._io_lock:
+            return self._send_raw_lines(
+                command,
+                timeout=timeout,
+                silence_timeout=silence_timeout,
+                min_wait_before_silence_break=min_wait_before_silence_break,
+            )
+
+    def _send_raw_lines(
+        self,
+        command: str,
+        *,
+        timeout: Optional[float],
+        silence_timeout: float,
+        min_wait_before_silence_break: float,
+    ) -> List[str]:
         self._check_connection()
         if timeout is None:
             timeout = self.timeout
 
+        # Set before the write so the error handlers below always have it
+        start = time.monotonic()
         try:
             self.last_command = command
             self.last_error = None
             self.last_duration_s = None
             self.last_raw_text = None
+            self.last_prompt_seen = False
             try:
                 self.connection.reset_input_buffer()
                 self.connection.reset_output_buffer()
@@ -166,18 +216,6 @@ class ELM327:
             received_meaningful = False
             prompt_seen = False
 
-            def _is_meaningful(lines: List[str]) -> bool:
-                for ln in lines:
-                    up = ln.strip().upper()
-                    if not up:
-                        continue
-                    if up.startswith("SEARCHING"):
-                        continue
-                    if up.startswith("BUS INIT") and "ERROR" not in up:
-                        continue
-                    return True
-                return False
-
             while True:
                 now = time.monotonic()
                 if (now - start) > timeout:
@@ -189,17 +227,12 @@ class ELM327:
                     buf.extend(chunk)
                     last_rx = now
                     received_any = True
-                    if b">" in chunk or b">" in buf:
+                    # Every byte of buf arrived in some chunk, so checking
+                    # the chunk is enough to spot the prompt
+                    if b">" in chunk:
                         prompt_seen = True
-                    if not received_meaningful:
-                        text = buf.decode("utf-8", errors="ignore")
-                        lines = [
-                            ln.strip()
-                            for ln in text.replace(">", "").replace("\r", "\n").split("\n")
-                            if ln.strip()
-                        ]
-                        if _is_meaningful(lines):
-                            received_meaningful = True
+                    if not received_meaningful and _has_meaningful_line(buf):
+                        received_meaningful = True
                     if prompt_seen and received_meaningful:
                         break
                 else:
@@ -219,6 +252,7 @@ class ELM327:
             lines = [ln.strip() for ln in text.split("\n") if ln.strip()]
             self.last_lines = lines
             self.last_raw_text = text
+            self.last_prompt_seen = prompt_seen
             self.last_duration_s = time.monotonic() - start
 
             if self.raw_logger:
@@ -261,7 +295,7 @@ class ELM327:
         if "?" in up_joined:
             return "INVALID"
 
-        return "".join(ch for ch in up_joined if ch in "0123456789ABCDEF")
+        return up_joined.encode("ascii", "ignore").translate(None, _NON_HEX_BYTES).decode("ascii")
 
     def send_obd_lines(self, command: str) -> List[str]:
         return self.send_raw_lines(command, timeout=max(self.timeout, 2.0))
@@ -284,7 +318,7 @@ class ELM327:
             if "4100" in compact:
                 if self.headers_on:
                     looks_like_header = any(
-                        re.match(r"^[0-9A-F]{3,8}\s", ln.strip().upper()) for ln in lines
+                        _HEADER_LINE_RE.match(ln.strip().upper()) for ln in lines
                     )
                     if not looks_like_header:
                         self.headers_on = False
@@ -301,7 +335,7 @@ class ELM327:
                     continue
                 return False
 
-            if any(err in joined for err in ["NO DATA", "UNABLE TO CONNECT", "CAN ERROR", "STOPPED"]):
+            if _LINK_ERROR_RE.search(joined):
                 if attempt < retries:
                     time.sleep(retry_delay_s)
                     continue
@@ -25,6 +25,11 @@ _PROTOCOL_MAP = {
 }
 
 
+# Replies that mean "not answering on this protocol (yet)"; one scan instead of
+# seven substring checks. "CAN ERROR" is covered by "ERROR".
+_NOT_READY_RE = re.compile(r"SEARCHING|BUS INIT|NO DATA|UNABLE TO CONNECT|STOPPED|ERROR", re.IGNORECASE)
+
+
 def negotiate_protocol(
     elm: "ELM327",
     *,
@@ -45,23 +50,12 @@ def negotiate_protocol(
             time.sleep(0.2)
             for attempt in range(retries + 1):
                 lines = elm.send_raw_lines("0100", timeout=use_timeout)
-                joined = " ".join(lines).upper()
-                compact = joined.replace(" ", "")
-                if "4100" in compact:
+                joined = " ".join(lines)
+                # "4100" is all digits: no upper() needed
+                if "4100" in joined.replace(" ", ""):
                     found = True
                     return p
-                if any(
-                    err in joined
-                    for err in [
-                        "SEARCHING",
-                        "BUS INIT",
-                        "NO DATA",
-                        "UNABLE TO CONNECT",
-                        "CAN ERROR",
-                        "STOPPED",
-                        "ERROR",
-                    ]
-                ):
+                if _NOT_READY_RE.search(joined):
                     if attempt < retries:
                         time.sleep(retry_delay_s)
                         continue
@@ -85,7 +79,8 @@ def get_protocol(elm: "ELM327") -> str:
         return "Unknown (disconnected)"
 
     code = None
-    m = re.search(r"([0-9A-F])", resp)
+    # "A6": protocol 6 picked by ATSP0 auto search; a lone "A" is J1939
+    m = re.search(r"\bA?([0-9A-C])\b", resp)
     if m:
         code = m.group(1)
 
@@ -14,6 +14,7 @@ from .verify import verify_profile
 from .detect import (
     detect_profile,
     detect_profile_report,
+    last_detected_family,
     DetectReport,
     CandidateAttempt,
     ProbeAttempt,
@@ -30,6 +31,7 @@ __all__ = [
     "verify_profile",
     "detect_profile",
     "detect_profile_report",
+    "last_detected_family",
     "DetectReport",
     "CandidateAttempt",
     "ProbeAttempt",
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import time
-from typing import Optional, Sequence
+from typing import List, Optional, Sequence
 
 from obd.elm.elm327 import ELM327
 from obd.kline.config.errors import (
@@ -10,7 +9,7 @@ from obd.kline.config.errors import (
     KLineProfileError,
 )
 from obd.kline.profiles.base import KLineProfile
-from obd.kline.runtime.routing import send_at_lines
+from obd.kline.runtime.routing import mark_adapter_cold, profile_runtime, send_at_batch
 from obd.kline.runtime.quirks import (
     QUIRK_FORCE_HEADERS_ON,
     QUIRK_FORCE_HEADERS_OFF,
@@ -28,11 +27,6 @@ DEFAULT_RESET_AT: Sequence[str] = (
 )
 
 
-def _sleep(s: float) -> None:
-    if s and s > 0:
-        time.sleep(s)
-
-
 def _effective_timeout(elm: ELM327, profile: KLineProfile) -> float:
     """
     elm.timeout puede ser None o no existir dependiendo del wrapper/clone.
@@ -77,44 +71,38 @@ def apply_profile(
     if profile.quirks.get(QUIRK_EXTRA_INTER_COMMAND_DELAY, False):
         extra_delay = 0.08  # conservador
 
+    # Sin prompt '>' se espera el delay completo; con prompt el ELM ya está
+    # listo y solo queda el extra del quirk (clones lentos) y el override
+    # explícito del caller, si lo hay.
     final_delay = base_delay + extra_delay
+    prompt_delay = (delay_override_s or 0.0) + extra_delay
     timeout_s = _effective_timeout(elm, profile)
 
-    cmd = ""  # para contexto en caso de crash
+    cmds: List[str] = []
+    if reset_before_apply:
+        cmds.extend(reset_at_commands)
 
-    try:
-        if reset_before_apply:
-            for cmd in reset_at_commands:
-                send_at_lines(elm, cmd, timeout_s=timeout_s)
-                _sleep(final_delay)
-
-        # Headers override por quirk
-        if profile.quirks.get(QUIRK_FORCE_HEADERS_ON, False):
-            cmd = "AT H1"
-            send_at_lines(elm, cmd, timeout_s=timeout_s)
-            _sleep(final_delay)
-
-        if profile.quirks.get(QUIRK_FORCE_HEADERS_OFF, False):
-            cmd = "AT H0"
-            send_at_lines(elm, cmd, timeout_s=timeout_s)
-            _sleep(final_delay)
-
-        # Apply init sequence
-        for cmd in profile.init_at:
-            send_at_lines(elm, cmd, timeout_s=timeout_s)
-            _sleep(final_delay)
-
-        # Apply options
-        for cmd in profile.options_at:
-            send_at_lines(elm, cmd, timeout_s=timeout_s)
-            _sleep(final_delay)
+    # Headers override por quirk
+    if profile.quirks.get(QUIRK_FORCE_HEADERS_ON, False):
+        cmds.append("AT H1")
+    if profile.quirks.get(QUIRK_FORCE_HEADERS_OFF, False):
+        cmds.append("AT H0")
 
+    # Init sequence + options (pre-normalizados una vez por perfil)
+    cmds.extend(profile_runtime(profile).at_cmds)
+
+    # Config nueva => el primer query vuelve a hacer settle
+    mark_adapter_cold(elm)
+
+    try:
+        send_at_batch(elm, cmds, timeout_s=timeout_s, delay_s=final_delay, prompt_delay_s=prompt_delay)
     except Exception as e:
         raise KLineApplyError(
             "Failed applying profile",
             ctx=KLineContext(
                 profile_name=profile.name,
-                at_or_obd_command=cmd,
+                # el ELM guarda el último comando enviado (contexto del crash)
+                at_or_obd_command=getattr(elm, "last_command", None),
             ),
             cause=e,
         ) from e
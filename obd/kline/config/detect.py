@@ -4,16 +4,52 @@ import time
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 
+from app.infrastructure.persistence.data_paths import last_kline_family_path
 from obd.elm.elm327 import ELM327
 from obd.kline.config.apply import apply_profile
 from obd.kline.config.errors import KLineContext, KLineDetectError
 from obd.kline.profiles.base import KLineProfile
-from obd.kline.runtime.policy import KLinePolicy, policy_for_profile
-from obd.kline.runtime.routing import query_profile_report
+from obd.kline.runtime.policy import KLinePolicy
+from obd.kline.runtime.routing import profile_runtime, query_profile_report
 from obd.kline.runtime.probes import probe_ok
+from obd.utils import DATACLASS_SLOTS
 
 
-@dataclass(frozen=True)
+# Familia del último perfil detectado OK (prior para el orden de candidatos).
+# Se guarda en disco para que la siguiente ejecución del CLI la pruebe primero.
+_last_detected_family: Optional[str] = None
+
+
+def _load_last_family() -> Optional[str]:
+    try:
+        return last_kline_family_path().read_text(encoding="utf-8").strip() or None
+    except OSError:
+        return None
+
+
+def _save_last_family(family: str) -> None:
+    try:
+        path = last_kline_family_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(family, encoding="utf-8")
+    except OSError:
+        pass
+
+
+def last_detected_family() -> Optional[str]:
+    """
+    Familia K-Line que ganó la última detección (None si aún no hubo).
+    Si en este proceso no se detectó nada, usa la guardada por una sesión anterior.
+    Útil con prefer_family()/td5_candidates(preferred=...).
+    """
+    global _last_detected_family
+
+    if _last_detected_family is None:
+        _last_detected_family = _load_last_family()
+    return _last_detected_family
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ProbeAttempt:
     probe: str
     ok: bool
@@ -21,7 +57,7 @@ class ProbeAttempt:
     lines_preview: List[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class CandidateAttempt:
     profile_name: str
     family: str
@@ -33,7 +69,7 @@ class CandidateAttempt:
     probes: List[ProbeAttempt] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class DetectReport:
     selected_profile: Optional[str]
     selected_reason: Optional[str]
@@ -61,6 +97,8 @@ def detect_profile_report(
 
     Retorna (profile ganador, DetectReport)
     """
+    global _last_detected_family
+
     if not candidates:
         raise KLineDetectError("No K-Line profile candidates provided")
 
@@ -68,7 +106,7 @@ def detect_profile_report(
     attempts: List[CandidateAttempt] = []
 
     for prof in candidates:
-        start = time.monotonic()
+        start = time.perf_counter_ns()
 
         apply_ok = True
         apply_error: Optional[str] = None
@@ -84,9 +122,10 @@ def detect_profile_report(
             apply_error = str(e)
 
         if apply_ok:
-            pol = policy_for_profile(prof, base=base_policy)
+            rt = profile_runtime(prof, base_policy)
+            pol = rt.policy
 
-            for probe in (prof.verify_obd or ["0100"]):
+            for probe in rt.probes:
                 lines, qrep = query_profile_report(elm, probe, profile=prof, base_policy=pol)
                 ok = probe_ok(probe, lines)
 
@@ -107,7 +146,7 @@ def detect_profile_report(
             if not verify_ok:
                 verify_reason = f"All probes failed: {[p.probe for p in probes_detail]}"
 
-        elapsed_ms = int((time.monotonic() - start) * 1000)
+        elapsed_ms = (time.perf_counter_ns() - start) // 1_000_000
 
         attempts.append(
             CandidateAttempt(
@@ -123,6 +162,9 @@ def detect_profile_report(
         )
 
         if verify_ok:
+            if prof.family != last_detected_family():
+                _save_last_family(prof.family)
+            _last_detected_family = prof.family
             report = DetectReport(
                 selected_profile=prof.name,
                 selected_reason=verify_reason,
@@ -6,8 +6,8 @@ from obd.elm.elm327 import ELM327
 from obd.kline.config.errors import KLineContext, KLineVerifyError
 from obd.kline.profiles.base import KLineProfile
 from obd.kline.runtime.policy import KLinePolicy
-from obd.kline.runtime.routing import query_profile
-from obd.kline.runtime.probes import probe_ok, strip_noise, extract_hex_blob
+from obd.kline.runtime.routing import profile_runtime, query_profile
+from obd.kline.runtime.probes import probe_ok, probe_hex_blob
 
 
 def verify_profile(
@@ -22,18 +22,18 @@ def verify_profile(
 
     IMPORTANTE: Usa query_profile() => aplica quirks/policy/warmup real.
     """
-    probes = profile.verify_obd or ["0100"]
+    # probes ya normalizados una vez por perfil (profile_runtime)
+    probes = profile_runtime(profile, policy).probes
 
     try:
         for probe in probes:
             raw_lines = query_profile(elm, probe, profile=profile, base_policy=policy)
 
             if probe_ok(probe, raw_lines):
-                cleaned = strip_noise(raw_lines)
-                blob = extract_hex_blob(cleaned if cleaned else raw_lines)
+                blob = probe_hex_blob(raw_lines)
                 return True, f"OK: probe {probe} matched; lines={raw_lines[:3]} hex={blob[:24]}"
 
-        return False, f"All probes failed: {probes}"
+        return False, f"All probes failed: {list(probes)}"
 
     except Exception as e:
         raise KLineVerifyError(
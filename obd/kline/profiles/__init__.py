@@ -1,4 +1,4 @@
-from .base import KLineProfile
+from .base import KLineProfile, prefer_family
 from .iso9141_2 import ISO9141_2
 from .kwp2000_5baud import KWP2000_5BAUD
 from .kwp2000_fast import KWP2000_FAST
@@ -6,6 +6,7 @@ from .land_rover_td5 import td5_candidates
 
 __all__ = [
     "KLineProfile",
+    "prefer_family",
     "ISO9141_2",
     "KWP2000_5BAUD",
     "KWP2000_FAST",
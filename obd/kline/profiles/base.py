@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 
 @dataclass(frozen=True)
@@ -11,7 +11,8 @@ class KLineProfile:
 
     Esta clase es intencionalmente conservadora:
     - Solo define 'AT commands' que suelen ser soportados por la mayoría de ELM/clones.
-    - Evita knobs experimentales (ST/AT/AL/etc.) hasta que tengamos evidencia del carro/adaptador.
+    - Timing: AT AT2 (adaptive agresivo) + AT ST explícito; evita otros knobs (AL/etc.)
+      hasta que tengamos evidencia del carro/adaptador.
 
     NOTA:
     - El IO lo hace config/apply + runtime/routing
@@ -20,13 +21,18 @@ class KLineProfile:
     family: str  # "iso9141_2" | "kwp2000_5baud" | "kwp2000_fast"
 
     # Secuencia base para activar protocolo, headers, etc.
-    init_at: List[str] = field(default_factory=list)
+    init_at: Tuple[str, ...] = ()
 
     # Opciones adicionales (conservadoras)
-    options_at: List[str] = field(default_factory=list)
+    options_at: Tuple[str, ...] = ()
 
     # Probes OBD para verificar comunicación
-    verify_obd: List[str] = field(default_factory=lambda: ["0100", "0902"])
+    verify_obd: Tuple[str, ...] = ("0100", "0902")
+
+    # Cantidad de respuestas esperadas (1..15) que se agrega a requests Mode 01
+    # de un solo PID (ej: "010C 1"): el ELM responde apenas llega esa cantidad
+    # en vez de esperar el timeout de silencio. None = no se agrega.
+    expected_responses: Optional[int] = None
 
     # Timeouts/delays recomendados para ese perfil
     request_timeout_s: float = 4.0
@@ -51,7 +57,20 @@ class KLineProfile:
                 if not isinstance(cmd, str) or not cmd.strip():
                     raise ValueError(f"Invalid AT command in profile '{self.name}': {cmd!r}")
 
+        if self.expected_responses is not None and not 1 <= self.expected_responses <= 15:
+            raise ValueError(f"Invalid expected_responses in profile '{self.name}': {self.expected_responses!r}")
+
         # probes básicos
         for p in self.verify_obd:
             if not isinstance(p, str) or not p.strip():
                 raise ValueError(f"Invalid verify probe in profile '{self.name}': {p!r}")
+
+
+def prefer_family(profiles: Sequence[KLineProfile], preferred: Optional[str]) -> List[KLineProfile]:
+    """
+    Reordena candidatos poniendo primero los de la familia preferida (ej: la que
+    funcionó la última vez). Orden estable: el resto queda como venía.
+    """
+    if not preferred:
+        return list(profiles)
+    return sorted(profiles, key=lambda p: p.family != preferred)
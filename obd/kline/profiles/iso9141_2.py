@@ -9,7 +9,7 @@ from obd.kline.runtime.quirks import (
 ISO9141_2 = KLineProfile(
     name="ISO9141-2 (ATSP3)",
     family="iso9141_2",
-    init_at=[
+    init_at=(
         # Selección de protocolo
         "AT SP 3",
         # Salida limpia (muy compatible con clones)
@@ -18,18 +18,22 @@ ISO9141_2 = KLineProfile(
         "AT S0",
         # Headers ON ayuda a parsing multi-ECU y debug
         "AT H1",
-    ],
-    options_at=[
-        # Opcionales conservadores: por ahora dejamos vacío.
-        # (Evitar AT ST/AT AT/AT AL hasta medir el TD5 real)
-    ],
-    verify_obd=[
+    ),
+    options_at=(
+        # Adaptive timing agresivo: el ELM corta apenas llegan los bytes
+        "AT AT2",
+        # Tope de espera por respuesta: 0x19 x 4 ms ~= 100 ms (default del ELM:
+        # 200 ms). Sigue siendo 2x el P2 max de ISO9141 (50 ms); AT2 lo acorta más.
+        "AT ST 19",
+    ),
+    verify_obd=(
         # Probes típicos:
         "0100",  # soporte mode01
         "010C",  # RPM (suele responder si mode01 vive)
         "0105",  # coolant temp
         "0902",  # VIN (si soporta mode09)
-    ],
+    ),
+    expected_responses=1,
     request_timeout_s=4.0,
     inter_command_delay_s=0.07,
     quirks={
@@ -9,19 +9,24 @@ from obd.kline.runtime.quirks import (
 KWP2000_5BAUD = KLineProfile(
     name="KWP2000 5-baud init (ATSP4)",
     family="kwp2000_5baud",
-    init_at=[
+    init_at=(
         "AT SP 4",
         "AT E0",
         "AT L0",
         "AT S0",
         "AT H1",
-    ],
-    verify_obd=[
+    ),
+    options_at=(
+        "AT AT2",
+        # 5-baud: margen más amplio, 0x64 x 4 ms ~= 400 ms
+        "AT ST 64",
+    ),
+    verify_obd=(
         "0100",
         "010C",
         "0105",
         "0902",
-    ],
+    ),
     # 5-baud init puede tardar más
     request_timeout_s=4.5,
     inter_command_delay_s=0.10,
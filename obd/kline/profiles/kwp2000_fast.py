@@ -9,19 +9,25 @@ from obd.kline.runtime.quirks import (
 KWP2000_FAST = KLineProfile(
     name="KWP2000 fast init (ATSP5)",
     family="kwp2000_fast",
-    init_at=[
+    init_at=(
         "AT SP 5",
         "AT E0",
         "AT L0",
         "AT S0",
         "AT H1",
-    ],
-    verify_obd=[
+    ),
+    options_at=(
+        "AT AT2",
+        # 0x19 x 4 ms ~= 100 ms (default 200 ms); 2x el P2 max de KWP2000 (50 ms)
+        "AT ST 19",
+    ),
+    verify_obd=(
         "0100",
         "010C",
         "0105",
         "0902",
-    ],
+    ),
+    expected_responses=1,
     request_timeout_s=4.5,
     inter_command_delay_s=0.09,
     quirks={
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional, Sequence
 
-from obd.kline.profiles.base import KLineProfile
+from obd.kline.profiles.base import KLineProfile, prefer_family
 from obd.kline.profiles.iso9141_2 import ISO9141_2
 from obd.kline.profiles.kwp2000_5baud import KWP2000_5BAUD
 from obd.kline.profiles.kwp2000_fast import KWP2000_FAST
@@ -12,16 +12,17 @@ from obd.kline.runtime.quirks import (
 )
 
 
-def _clone_with(profile: KLineProfile, *, name_suffix: str, verify_obd: List[str], quirks_extra: dict) -> KLineProfile:
+def _clone_with(profile: KLineProfile, *, name_suffix: str, verify_obd: Sequence[str], quirks_extra: dict) -> KLineProfile:
     """
     Como KLineProfile es frozen, hacemos “clone” limpio con overrides.
     """
     return KLineProfile(
         name=f"{profile.name} {name_suffix}",
         family=profile.family,
-        init_at=list(profile.init_at),
-        options_at=list(profile.options_at),
-        verify_obd=verify_obd,
+        init_at=profile.init_at,
+        options_at=profile.options_at,
+        verify_obd=tuple(verify_obd),
+        expected_responses=profile.expected_responses,
         request_timeout_s=profile.request_timeout_s,
         inter_command_delay_s=profile.inter_command_delay_s,
         quirks={**profile.quirks, **quirks_extra},
@@ -29,14 +30,15 @@ def _clone_with(profile: KLineProfile, *, name_suffix: str, verify_obd: List[str
     )
 
 
-def td5_candidates() -> List[KLineProfile]:
+def td5_candidates(preferred: Optional[str] = None) -> List[KLineProfile]:
     """
     TD5 (y otros Land Rover de esa era) pueden responder por ISO9141 o KWP.
     El orden acá es intencional: muchos TD5 terminan en KWP (pero no apostamos a ciegas).
+    preferred: familia que ganó antes (ej: last_detected_family()); se prueba primero.
     """
     # Probes recomendados para “vida real”
     # 010C/0105 suelen confirmar si hay comunicación, más que 0100 solo.
-    td5_probes = ["0100", "010C", "0105", "0902"]
+    td5_probes = ("0100", "010C", "0105", "0902")
 
     # Algunos ECUs TD5 pueden dar NO DATA intermitente al principio → retry
     td5_quirks = {
@@ -44,8 +46,8 @@ def td5_candidates() -> List[KLineProfile]:
         QUIRK_EXTRA_INTER_COMMAND_DELAY: True,
     }
 
-    return [
+    return prefer_family([
         _clone_with(KWP2000_5BAUD, name_suffix="[TD5]", verify_obd=td5_probes, quirks_extra=td5_quirks),
         _clone_with(KWP2000_FAST, name_suffix="[TD5]", verify_obd=td5_probes, quirks_extra=td5_quirks),
         _clone_with(ISO9141_2, name_suffix="[TD5]", verify_obd=td5_probes, quirks_extra=td5_quirks),
-    ]
+    ], preferred)
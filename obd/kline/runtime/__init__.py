@@ -8,13 +8,17 @@ from .quirks import (
     QUIRK_RETRY_ON_NO_DATA,
     QUIRK_IGNORE_UNABLE_TO_CONNECT,
     QUIRK_REQUIRE_WARMUP_PROBE,
+    analyze_response,
 )
 from .routing import (
     send_at_lines,
+    send_at_batch,
     send_obd_lines,
     query_with_policy,
     query_profile,
     query_profile_report,
+    profile_runtime,
+    ProfileRuntime,
     QueryReport,
     QueryAttempt,
 )
@@ -30,11 +34,15 @@ __all__ = [
     "QUIRK_RETRY_ON_NO_DATA",
     "QUIRK_IGNORE_UNABLE_TO_CONNECT",
     "QUIRK_REQUIRE_WARMUP_PROBE",
+    "analyze_response",
     "send_at_lines",
+    "send_at_batch",
     "send_obd_lines",
     "query_with_policy",
     "query_profile",
     "query_profile_report",
+    "profile_runtime",
+    "ProfileRuntime",
     "QueryReport",
     "QueryAttempt",
 ]
@@ -24,6 +24,8 @@ class KLinePolicy:
     - warmup_probe: comando OBD para calentar (default: "0100")
     - warmup_attempts: cuántas veces intentar warmup
     - warmup_delay_s: delay después de warmup
+    - skip_initial_settle: nunca hacer el settle inicial (si no, se omite solo
+      cuando el adapter ya respondió OK desde el último apply)
     """
     retries: int = 1
     timeout_s: float = 4.0
@@ -38,6 +40,8 @@ class KLinePolicy:
     warmup_attempts: int = 1
     warmup_delay_s: float = 0.10
 
+    skip_initial_settle: bool = False
+
     def with_overrides(
         self,
         *,
@@ -50,6 +54,7 @@ class KLinePolicy:
         warmup_probe: Optional[str] = None,
         warmup_attempts: Optional[int] = None,
         warmup_delay_s: Optional[float] = None,
+        skip_initial_settle: Optional[bool] = None,
     ) -> "KLinePolicy":
         p = self
         if retries is not None:
@@ -70,6 +75,8 @@ class KLinePolicy:
             p = replace(p, warmup_attempts=warmup_attempts)
         if warmup_delay_s is not None:
             p = replace(p, warmup_delay_s=warmup_delay_s)
+        if skip_initial_settle is not None:
+            p = replace(p, skip_initial_settle=skip_initial_settle)
         return p
 
 
@@ -1,9 +1,30 @@
 from __future__ import annotations
 
-import re
-from typing import List
+from functools import lru_cache
+from typing import Callable, Dict, List, Sequence, Tuple
 
-_HEX_RE = re.compile(r"^[0-9A-F]+$")
+from obd.kline.runtime.quirks import classify_marker, hex_only
+
+
+# Prefijos de ruido del ELM; str.startswith(tuple) los prueba todos en C.
+DROP_PREFIX_TUPLE = (
+    "SEARCHING",
+    "BUS INIT",
+    "STOPPED",
+    "OK",
+    "ELM",
+)
+
+
+def _is_noise_upper(up: str) -> bool:
+    """
+    up: línea YA strip + upper.
+    """
+    if not up:
+        return True
+    if up.startswith(DROP_PREFIX_TUPLE):
+        return True
+    return up in (">", "?")
 
 
 def strip_noise(lines: List[str]) -> List[str]:
@@ -11,56 +32,65 @@ def strip_noise(lines: List[str]) -> List[str]:
     El ELM puede meter ruido tipo: SEARCHING..., BUS INIT..., etc.
     Removemos lo obvio pero sin destruir payload.
     """
-    drop_prefix = (
-        "SEARCHING",
-        "BUS INIT",
-        "STOPPED",
-        "OK",
-        "ELM",
-    )
-    cleaned: List[str] = []
-    for ln in lines:
-        up = ln.strip().upper()
-        if not up:
-            continue
-        if any(up.startswith(x) for x in drop_prefix):
-            continue
-        if up in (">", "?"):
-            continue
-        cleaned.append(ln.strip())
-    return cleaned
+    return [ln.strip() for ln in lines if not _is_noise_upper(ln.strip().upper())]
 
 
 def extract_hex_blob(lines: List[str]) -> str:
     """
     Une líneas y deja solo hex (tolerante a headers/texto).
     """
-    up = " ".join(lines).upper()
-    return "".join(ch for ch in up if ch in "0123456789ABCDEF")
+    return hex_only(" ".join(lines))
 
 
-def looks_like_hex(hex_blob: str) -> bool:
-    return bool(hex_blob) and (_HEX_RE.match(hex_blob) is not None)
+@lru_cache(maxsize=128)
+def _cached_extract(lines: Tuple[str, ...]) -> Tuple[str, str]:
+    """
+    Un solo upper() por línea; de ahí salen el texto unido (para marcadores)
+    y el blob hex (sin ruido).
+    """
+    up_lines = [ln.strip().upper() for ln in lines]
+    cleaned = [up for up in up_lines if not _is_noise_upper(up)]
+    blob = hex_only(" ".join(cleaned if cleaned else up_lines))
+    return " ".join(up_lines), blob
 
 
-def matches_probe_pattern(probe: str, hex_blob: str) -> bool:
+def probe_hex_blob(raw_lines: Sequence[str]) -> str:
     """
-    Patrones mínimos “reales” por probe.
+    strip_noise + extract_hex_blob, memoizado por respuesta cruda.
+    Los retries/detect suelen re-evaluar exactamente las mismas líneas.
     """
-    p = probe.strip().upper()
-    if p == "0100":
-        return "4100" in hex_blob and len(hex_blob) >= 12
-    if p == "010C":
-        return "410C" in hex_blob and len(hex_blob) >= 10
-    if p == "0105":
-        return "4105" in hex_blob and len(hex_blob) >= 10
-    if p == "0902":
-        return "4902" in hex_blob and len(hex_blob) >= 10
+    return _cached_extract(tuple(raw_lines))[1]
+
 
+def looks_like_hex(hex_blob: str) -> bool:
+    """
+    extract_hex_blob() ya garantiza que solo quedan chars hex,
+    así que basta con que no esté vacío.
+    """
+    return bool(hex_blob)
+
+
+def _looks_like_any(hex_blob: str) -> bool:
     # probe desconocido: con que haya hex razonable
     return looks_like_hex(hex_blob) and len(hex_blob) >= 8
 
 
+# Patrones mínimos “reales” por probe (dispatch por dict en vez de cadena de if)
+_CHECKS: Dict[str, Callable[[str], bool]] = {
+    "0100": lambda b: "4100" in b and len(b) >= 12,
+    "010C": lambda b: "410C" in b and len(b) >= 10,
+    "0105": lambda b: "4105" in b and len(b) >= 10,
+    "0902": lambda b: "4902" in b and len(b) >= 10,
+}
+
+
+def matches_probe_pattern(probe: str, hex_blob: str) -> bool:
+    """
+    Patrones mínimos “reales” por probe.
+    """
+    return _CHECKS.get(probe.strip().upper(), _looks_like_any)(hex_blob)
+
+
 def probe_ok(probe: str, raw_lines: List[str]) -> bool:
     """
     Evalúa un probe usando:
@@ -69,12 +99,10 @@ def probe_ok(probe: str, raw_lines: List[str]) -> bool:
     - match por patrón
     - filtro rápido de errores textuales
     """
-    up = " ".join(raw_lines).upper()
     if not raw_lines:
         return False
-    if "NO DATA" in up or "UNABLE TO CONNECT" in up or "ERROR" in up or "DISCONNECTED" in up:
+    up, blob = _cached_extract(tuple(raw_lines))
+    if classify_marker(up) in ("no_data", "no_connect", "error"):
         return False
 
-    cleaned = strip_noise(raw_lines)
-    blob = extract_hex_blob(cleaned if cleaned else raw_lines)
     return matches_probe_pattern(probe, blob) or (looks_like_hex(blob) and len(blob) >= 10)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+
+from obd.utils import DATACLASS_SLOTS
 
 
 # Quirk keys (convención)
@@ -16,8 +19,26 @@ QUIRK_IGNORE_UNABLE_TO_CONNECT = "ignore_unable_to_connect"
 
 QUIRK_REQUIRE_WARMUP_PROBE = "require_warmup_probe"
 
+_HEX_CHARS = b"0123456789ABCDEFabcdef"
+# Un solo bytes.translate (loop en C): borra todo byte no-hex y pasa a-f -> A-F,
+# así no hace falta un .upper() previo sobre el texto.
+_NON_HEX_BYTES = bytes(b for b in range(256) if b not in _HEX_CHARS)
+_UPPER_HEX_TABLE = bytes.maketrans(b"abcdef", b"ABCDEF")
+
+# Marcadores textuales del ELM: una sola pasada de regex en vez de N "x in up".
+_MARKER_RE = re.compile(r"NO DATA|UNABLE TO CONNECT|DISCONNECTED|ERROR|\?")
+
+# Orden = prioridad (si aparecen varios en la misma respuesta)
+_MARKER_KINDS = (
+    ("NO DATA", "no_data"),
+    ("UNABLE TO CONNECT", "no_connect"),
+    ("DISCONNECTED", "error"),
+    ("ERROR", "error"),
+    ("?", "invalid"),
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class QuirkSet:
     """
     Flags/params para workarounds.
@@ -37,33 +58,67 @@ class QuirkSet:
         return float(self.params.get(key, default))
 
 
-def classify_response(lines: list[str]) -> str:
+def hex_only_bytes(data: bytes) -> bytes:
+    """
+    Deja solo hex (en mayúsculas) de bytes ASCII crudos.
+    """
+    return data.translate(_UPPER_HEX_TABLE, _NON_HEX_BYTES)
+
+
+def hex_only(text: str) -> str:
+    """
+    Deja solo chars hex (en mayúsculas) de un texto; no necesita .upper() previo.
+    """
+    return hex_only_bytes(text.encode("ascii", "ignore")).decode("ascii")
+
+
+def _kind_from_markers(found: set) -> Optional[str]:
+    for marker, kind in _MARKER_KINDS:
+        if marker in found:
+            return kind
+    return None
+
+
+def classify_marker(up: str) -> Optional[str]:
+    """
+    Categoría del marcador textual (NO DATA, ERROR, ...) en un texto YA en mayúsculas.
+    None si no hay ninguno.
+    """
+    found = {m.group(0) for m in _MARKER_RE.finditer(up)}
+    if not found:
+        return None
+    return _kind_from_markers(found)
+
+
+def analyze_response(lines: list[str]) -> Tuple[str, bool]:
+    """
+    Una sola pasada (upper-join + regex) -> (kind, hard_fail).
+    kind: mismo valor que classify_response(); hard_fail: ELM "DISCONNECTED".
+    """
     if not lines:
-        return "empty"
+        return "empty", False
 
     up = " ".join(lines).upper()
+    found = {m.group(0) for m in _MARKER_RE.finditer(up)}
+    hard_fail = "DISCONNECTED" in found
 
-    if "NO DATA" in up:
-        return "no_data"
-    if "UNABLE TO CONNECT" in up:
-        return "no_connect"
-    if "DISCONNECTED" in up:
-        return "error"
-    if "ERROR" in up:
-        return "error"
-    if "?" in up:
-        return "invalid"
+    kind = _kind_from_markers(found) if found else None
+    if kind is not None:
+        return kind, hard_fail
 
     # Heurística: si no hay casi hex, no es respuesta real
-    hex_blob = "".join(ch for ch in up if ch in "0123456789ABCDEF")
-    if len(hex_blob) < 6:
-        return "invalid"
+    if len(hex_only(up)) < 6:
+        return "invalid", hard_fail
 
-    return "ok"
+    return "ok", hard_fail
 
 
-def is_retryable_response(
-    lines: list[str],
+def classify_response(lines: list[str]) -> str:
+    return analyze_response(lines)[0]
+
+
+def is_retryable_kind(
+    kind: str,
     *,
     retry_on_no_data: bool,
     ignore_unable_to_connect: bool,
@@ -73,8 +128,6 @@ def is_retryable_response(
     - no_connect (UNABLE TO CONNECT) por defecto NO retry (para no perder tiempo)
     - pero si el quirk ignore_unable_to_connect está ON, entonces sí retry.
     """
-    kind = classify_response(lines)
-
     if kind in ("empty", "error", "invalid"):
         return True
 
@@ -87,8 +140,18 @@ def is_retryable_response(
     return False
 
 
+def is_retryable_response(
+    lines: list[str],
+    *,
+    retry_on_no_data: bool,
+    ignore_unable_to_connect: bool,
+) -> bool:
+    return is_retryable_kind(
+        classify_response(lines),
+        retry_on_no_data=retry_on_no_data,
+        ignore_unable_to_connect=ignore_unable_to_connect,
+    )
+
+
 def response_is_hard_fail(lines: list[str]) -> bool:
-    up = " ".join(lines).upper()
-    if "DISCONNECTED" in up:
-        return True
-    return False
+    return analyze_response(lines)[1]
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import re
 import time
+import weakref
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from obd.elm.elm327 import ELM327
 from obd.kline.profiles.base import KLineProfile
@@ -11,10 +13,10 @@ from obd.kline.runtime.quirks import (
     QuirkSet,
     QUIRK_RETRY_ON_NO_DATA,
     QUIRK_IGNORE_UNABLE_TO_CONNECT,
-    classify_response,
-    is_retryable_response,
-    response_is_hard_fail,
+    analyze_response,
+    is_retryable_kind,
 )
+from obd.utils import DATACLASS_SLOTS
 
 
 def _sleep(s: float) -> None:
@@ -22,6 +24,24 @@ def _sleep(s: float) -> None:
         time.sleep(s)
 
 
+# Adapters que ya dieron una respuesta OK desde el último apply_profile():
+# ahí el settle inicial ya no aporta nada. WeakSet para no retener ELMs cerrados.
+_WARMED_ADAPTERS: "weakref.WeakSet[ELM327]" = weakref.WeakSet()
+
+
+def mark_adapter_cold(elm: ELM327) -> None:
+    """
+    Vuelve a exigir el settle inicial (ej: después de reconfigurar el ELM).
+    """
+    _WARMED_ADAPTERS.discard(elm)
+
+
+def _initial_settle(elm: ELM327, policy: KLinePolicy) -> None:
+    if policy.skip_initial_settle or elm in _WARMED_ADAPTERS:
+        return
+    _sleep(policy.initial_settle_delay_s)
+
+
 def _normalize_at(cmd: str) -> str:
     cmd = cmd.strip()
     if not cmd:
@@ -31,6 +51,99 @@ def _normalize_at(cmd: str) -> str:
     return f"AT {cmd}"
 
 
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class ProfileRuntime:
+    """
+    Artefactos derivados de un perfil (inmutable) + base policy.
+    """
+    policy: KLinePolicy
+    quirks: QuirkSet
+    at_cmds: Tuple[str, ...]
+    # verify_obd normalizado (upper/strip), con fallback "0100"
+    probes: Tuple[str, ...]
+
+
+_RUNTIME_CACHE_MAX = 32
+# (id(profile), base) -> (profile, runtime); guardamos el profile para que el id
+# no se recicle mientras la entrada exista.
+_RUNTIME_CACHE: Dict[Tuple[int, Optional[KLinePolicy]], Tuple[KLineProfile, ProfileRuntime]] = {}
+
+
+def profile_runtime(profile: KLineProfile, base: Optional[KLinePolicy] = None) -> ProfileRuntime:
+    """
+    Policy, QuirkSet y AT init/options normalizados del perfil, calculados una sola vez.
+    El cache es por identidad: hash(profile) falla porque quirks es un dict, y
+    aunque no fallara, hashear todos los campos en cada query cuesta más que id().
+    """
+    key = (id(profile), base)
+    hit = _RUNTIME_CACHE.get(key)
+    if hit is not None and hit[0] is profile:
+        return hit[1]
+
+    rt = ProfileRuntime(
+        policy=policy_for_profile(profile, base=base),
+        quirks=QuirkSet.from_profile_dict(profile.quirks),
+        at_cmds=tuple(_normalize_at(c) for c in (*profile.init_at, *profile.options_at)),
+        probes=tuple(p.strip().upper() for p in (profile.verify_obd or ("0100",))),
+    )
+    if len(_RUNTIME_CACHE) >= _RUNTIME_CACHE_MAX:
+        _RUNTIME_CACHE.clear()
+    _RUNTIME_CACHE[key] = (profile, rt)
+    return rt
+
+
+# Adapters que respondieron "?" a un request con conteo de respuestas (ej:
+# "0100 1"): clones que dicen ser v1.3+ pero no lo implementan.
+_NO_RESPONSE_COUNT: "weakref.WeakSet[ELM327]" = weakref.WeakSet()
+
+_ELM_VERSION_RE = re.compile(r"V\s*(\d+)\.(\d+)", re.IGNORECASE)
+
+
+def _supports_response_count(elm: ELM327) -> bool:
+    """
+    El conteo de respuestas existe desde ELM327 v1.3; firmwares anteriores (y
+    versiones desconocidas) responden "?" al comando completo.
+    """
+    if elm in _NO_RESPONSE_COUNT:
+        return False
+    m = _ELM_VERSION_RE.search(getattr(elm, "elm_version", None) or "")
+    return m is not None and (int(m.group(1)), int(m.group(2))) >= (1, 3)
+
+
+def _profile_cmd(cmd: str, profile: KLineProfile, elm: ELM327) -> str:
+    """
+    Agrega el conteo de respuestas esperadas del perfil a requests Mode 01 de un PID.
+    Solo ahí: Mode 03/09 en K-Line pueden venir en varios mensajes (DTCs, VIN).
+    """
+    n = profile.expected_responses
+    cmd = cmd.strip().upper()
+    if n and len(cmd) == 4 and cmd.startswith("01") and _supports_response_count(elm):
+        return f"{cmd} {n:X}"
+    return cmd
+
+
+def _send_profile_cmd(
+    elm: ELM327,
+    cmd: str,
+    wire_cmd: str,
+    *,
+    timeout_s: Optional[float],
+) -> Tuple[List[str], str]:
+    """
+    Envía wire_cmd; si lleva conteo y el ELM responde "?" (comando rechazado),
+    reenvía el comando pelado y recuerda que este adapter no soporta el conteo.
+    Una respuesta corta o cortada sin "?" no cuenta: es ruido de la línea.
+    Retorna (líneas, wire_cmd a usar en los siguientes intentos).
+    """
+    lines = send_obd_lines(elm, wire_cmd, timeout_s=timeout_s)
+    bare = cmd.strip().upper()
+    if wire_cmd != bare and any(ln.strip() == "?" for ln in lines):
+        _NO_RESPONSE_COUNT.add(elm)
+        lines = send_obd_lines(elm, bare, timeout_s=timeout_s)
+        wire_cmd = bare
+    return lines, wire_cmd
+
+
 def send_at_lines(elm: ELM327, cmd: str, *, timeout_s: Optional[float] = None) -> List[str]:
     """
     Envía comando AT y devuelve líneas crudas.
@@ -39,6 +152,29 @@ def send_at_lines(elm: ELM327, cmd: str, *, timeout_s: Optional[float] = None) -
     return elm.send_raw_lines(cmd, timeout=timeout_s)
 
 
+def send_at_batch(
+    elm: ELM327,
+    cmds: Sequence[str],
+    *,
+    timeout_s: Optional[float] = None,
+    delay_s: float = 0.0,
+    prompt_delay_s: float = 0.0,
+) -> List[List[str]]:
+    """
+    Envía una secuencia de comandos AT y devuelve las líneas de cada uno.
+
+    OJO: no se concatenan en un solo write; el ELM327 aborta el comando en curso
+    si recibe otro byte mientras procesa. Se envían uno por uno y después de cada
+    comando se espera delay_s, o prompt_delay_s si el ELM ya devolvió el prompt
+    '>' (listo para el siguiente; el caller decide cuánto ritmo extra dejar).
+    """
+    out: List[List[str]] = []
+    for cmd in cmds:
+        out.append(send_at_lines(elm, cmd, timeout_s=timeout_s))
+        _sleep(prompt_delay_s if getattr(elm, "last_prompt_seen", False) else delay_s)
+    return out
+
+
 def send_obd_lines(elm: ELM327, cmd: str, *, timeout_s: Optional[float] = None) -> List[str]:
     """
     Envía request OBD (ej: '0100') y devuelve líneas crudas.
@@ -47,7 +183,7 @@ def send_obd_lines(elm: ELM327, cmd: str, *, timeout_s: Optional[float] = None)
     return elm.send_raw_lines(cmd, timeout=timeout_s)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class QueryAttempt:
     attempt: int
     elapsed_ms: int
@@ -55,7 +191,7 @@ class QueryAttempt:
     lines_preview: List[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class QueryReport:
     cmd: str
     attempts: List[QueryAttempt]
@@ -85,13 +221,13 @@ def _do_warmup(
 
     for _ in range(max(1, policy.warmup_attempts)):
         lines = send_obd_lines(elm, policy.warmup_probe, timeout_s=timeout_s)
-        if response_is_hard_fail(lines):
+        kind, hard_fail = analyze_response(lines)
+        if hard_fail:
             return
-        kind = classify_response(lines)
         if kind == "ok":
             _sleep(policy.warmup_delay_s)
             return
-        if not is_retryable_response(lines, retry_on_no_data=retry_on_no_data, ignore_unable_to_connect=ignore_no_connect):
+        if not is_retryable_kind(kind, retry_on_no_data=retry_on_no_data, ignore_unable_to_connect=ignore_no_connect):
             return
         _sleep(policy.inter_request_delay_s)
 
@@ -110,8 +246,8 @@ def query_with_policy(
     t = timeout_s if timeout_s is not None else policy.timeout_s
     last_lines: List[str] = []
 
-    # settle inicial
-    _sleep(policy.initial_settle_delay_s)
+    # settle inicial (solo mientras el adapter no haya respondido OK)
+    _initial_settle(elm, policy)
 
     # warmup (si aplica)
     # Nota: aquí no hay profile; se usa el policy tal cual. Si quieres warmup por profile,
@@ -119,21 +255,21 @@ def query_with_policy(
     # (config/verify ya usa policy_for_profile(profile) si lo deseas)
     # -> Dejamos warmup en query_profile().
     for attempt in range(policy.retries + 1):
-        start = time.monotonic()
         last_lines = send_obd_lines(elm, cmd, timeout_s=t)
-        elapsed_ms = int((time.monotonic() - start) * 1000)
 
-        if response_is_hard_fail(last_lines):
+        up_kind, hard_fail = analyze_response(last_lines)
+        if hard_fail:
             return last_lines
 
-        up_kind = classify_response(last_lines)
-
         # Si está OK, devolvemos inmediatamente.
         if up_kind == "ok":
+            _WARMED_ADAPTERS.add(elm)
             return last_lines
 
-        # Delay entre requests
-        _sleep(policy.inter_request_delay_s)
+        # Delay entre requests: si el ELM ya devolvió el prompt '>' está listo
+        # para el siguiente comando, no hace falta esperar.
+        if not getattr(elm, "last_prompt_seen", False):
+            _sleep(policy.inter_request_delay_s)
 
         # Backoff incremental si hay múltiples intentos
         if policy.backoff_s > 0:
@@ -153,36 +289,36 @@ def query_profile(
     """
     Query “producto”: toma profile + base_policy y aplica quirks reales (retry_on_no_data, warmup, etc.)
     """
-    pol = policy_for_profile(profile, base=base_policy)
-    qs = QuirkSet.from_profile_dict(profile.quirks)
+    rt = profile_runtime(profile, base_policy)
+    pol = rt.policy
+    qs = rt.quirks
     t = timeout_s if timeout_s is not None else pol.timeout_s
 
     retry_on_no_data = qs.enabled(QUIRK_RETRY_ON_NO_DATA, default=False)
     ignore_no_connect = qs.enabled(QUIRK_IGNORE_UNABLE_TO_CONNECT, default=False)
+    wire_cmd = _profile_cmd(cmd, profile, elm)
 
     # settle inicial
-    _sleep(pol.initial_settle_delay_s)
+    _initial_settle(elm, pol)
 
     # warmup probe si corresponde
     _do_warmup(elm, policy=pol, quirks=qs, timeout_s=t)
 
     last_lines: List[str] = []
     for attempt in range(pol.retries + 1):
-        start = time.monotonic()
-        last_lines = send_obd_lines(elm, cmd, timeout_s=t)
-        elapsed_ms = int((time.monotonic() - start) * 1000)
+        last_lines, wire_cmd = _send_profile_cmd(elm, cmd, wire_cmd, timeout_s=t)
 
-        if response_is_hard_fail(last_lines):
+        kind, hard_fail = analyze_response(last_lines)
+        if hard_fail:
             return last_lines
 
-        kind = classify_response(last_lines)
-
         # éxito
         if kind == "ok":
+            _WARMED_ADAPTERS.add(elm)
             return last_lines
 
         # ¿retry?
-        if not is_retryable_response(last_lines, retry_on_no_data=retry_on_no_data, ignore_unable_to_connect=ignore_no_connect):
+        if not is_retryable_kind(kind, retry_on_no_data=retry_on_no_data, ignore_unable_to_connect=ignore_no_connect):
             return last_lines
 
         # delays
@@ -204,25 +340,27 @@ def query_profile_report(
     """
     Igual que query_profile, pero devuelve reporte de intentos (para debug/telemetría).
     """
-    pol = policy_for_profile(profile, base=base_policy)
-    qs = QuirkSet.from_profile_dict(profile.quirks)
+    rt = profile_runtime(profile, base_policy)
+    pol = rt.policy
+    qs = rt.quirks
     t = timeout_s if timeout_s is not None else pol.timeout_s
 
     retry_on_no_data = qs.enabled(QUIRK_RETRY_ON_NO_DATA, default=False)
     ignore_no_connect = qs.enabled(QUIRK_IGNORE_UNABLE_TO_CONNECT, default=False)
+    wire_cmd = _profile_cmd(cmd, profile, elm)
 
     attempts: List[QueryAttempt] = []
 
-    _sleep(pol.initial_settle_delay_s)
+    _initial_settle(elm, pol)
     _do_warmup(elm, policy=pol, quirks=qs, timeout_s=t)
 
     last_lines: List[str] = []
     for attempt in range(pol.retries + 1):
-        start = time.monotonic()
-        last_lines = send_obd_lines(elm, cmd, timeout_s=t)
-        elapsed_ms = int((time.monotonic() - start) * 1000)
+        start = time.perf_counter_ns()
+        last_lines, wire_cmd = _send_profile_cmd(elm, cmd, wire_cmd, timeout_s=t)
+        elapsed_ms = (time.perf_counter_ns() - start) // 1_000_000
 
-        kind = classify_response(last_lines)
+        kind, hard_fail = analyze_response(last_lines)
         attempts.append(
             QueryAttempt(
                 attempt=attempt,
@@ -232,13 +370,14 @@ def query_profile_report(
             )
         )
 
-        if response_is_hard_fail(last_lines):
+        if hard_fail:
             return last_lines, QueryReport(cmd=cmd, attempts=attempts)
 
         if kind == "ok":
+            _WARMED_ADAPTERS.add(elm)
             return last_lines, QueryReport(cmd=cmd, attempts=attempts)
 
-        if not is_retryable_response(last_lines, retry_on_no_data=retry_on_no_data, ignore_unable_to_connect=ignore_no_connect):
+        if not is_retryable_kind(kind, retry_on_no_data=retry_on_no_data, ignore_unable_to_connect=ignore_no_connect):
             return last_lines, QueryReport(cmd=cmd, attempts=attempts)
 
         _sleep(pol.inter_request_delay_s)
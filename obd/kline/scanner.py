@@ -7,6 +7,7 @@ from obd.dtc import parse_dtc_response, lookup_code, get_database
 from obd.pids.registry import get_pid_info
 from obd.pids.decode import decode_pid_response
 
+from obd.kline.runtime.quirks import hex_only
 from obd.kline.session import KLineSession
 
 
@@ -93,7 +94,7 @@ class KLineScanner:
         up = " ".join(lines).upper()
 
         # Algunos ECUs responden "44" (respuesta a 04), otros solo "OK"
-        hex_blob = "".join(ch for ch in up if ch in "0123456789ABCDEF")
+        hex_blob = hex_only(up)
 
         if "DISCONNECTED" in up:
             return False, "ELM disconnected"
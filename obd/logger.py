@@ -1,19 +1,84 @@
 """
 Session Logger Module
 =====================
-Handles logging of OBD sessions to CSV and JSON files.
+Handles logging of OBD sessions to CSV and JSON (newline-delimited) files.
 """
 
 from __future__ import annotations
 
 import csv
+import io
 import json
+import os
+import re
+import sys
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set, Tuple
 
 from .utils import cr_now, cr_timestamp, cr_timestamp_filename
 from app.infrastructure.persistence.data_paths import logs_dir
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+# Large write buffer: rows reach the disk in big chunks instead of one write per row.
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Characters that make the csv module quote a cell (QUOTE_MINIMAL, default dialect).
+_CSV_SPECIAL_RE = re.compile(r'[,"\r\n]')
+
+# Session file suffixes; ".json" covers older single-document sessions.
+_SESSION_SUFFIXES = (".csv", ".ndjson", ".json")
+
+# PID name -> short column name
+_PID_COLUMN_MAP: Dict[str, str] = {
+    "Engine Coolant Temperature": "coolant",
+    "Engine RPM": "rpm",
+    "Vehicle Speed": "speed",
+    "Throttle Position": "throttle",
+    "Relative Throttle Position": "throttle_rel",
+    "Accelerator Pedal Position D": "pedal_d",
+    "Accelerator Pedal Position E": "pedal_e",
+    "Control Module Voltage": "voltage",
+    "Intake Manifold Pressure": "map",
+    "Intake Air Temperature": "iat",
+    "Short Term Fuel Trim - Bank 1": "stft_b1",
+    "Long Term Fuel Trim - Bank 1": "ltft_b1",
+    "Calculated Engine Load": "load",
+    "Timing Advance": "timing",
+    "MAF Air Flow Rate": "maf",
+    "Fuel Tank Level": "fuel_level",
+    "Commanded Throttle Actuator": "throttle_cmd",
+}
+
+
+def _dumps_row(row: Dict[str, Any]) -> bytes:
+    """Serialize one JSON session row (compact, one line, UTF-8)."""
+    if orjson is not None:
+        return orjson.dumps(row, default=str)
+    return json.dumps(row, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+
+
+def _open_session_file(path: Path) -> io.TextIOWrapper:
+    """
+    Text handle over a large binary buffer.
+
+    write_through=True keeps the text layer from holding pending data, so hot
+    paths can write pre-encoded bytes straight to ``handle.buffer`` while the
+    csv module keeps writing text to the same handle, in order.
+    """
+    raw = open(path, "wb", buffering=_WRITE_BUFFER_SIZE)
+    return io.TextIOWrapper(raw, encoding="utf-8", newline="", write_through=True)
+
+
+@lru_cache(maxsize=256)
+def _fallback_colname(name: str) -> str:
+    return name.lower().replace(" ", "_")[:20]
+
 
 class SessionLogger:
     """
@@ -41,17 +106,43 @@ class SessionLogger:
         self.reading_count: int = 0
         self._csv_writer = None
         self._file_handle = None
-        self._json_data: List[Dict] = []
         self._headers_written: bool = False
         self._csv_fieldnames: List[str] = []
+        self._csv_fieldnames_set: Set[str] = set()
+        self._flush_interval: int = 0
+        # reading name -> (value column, unit column); names never change per PID
+        self._col_cache: Dict[str, Tuple[str, str]] = {}
+        # Dict rows, or tuples already in CSV column order (steady-state live data)
+        self._row_buffer: List[Any] = []
+        # PID keys whose live-data row maps 1:1 onto CSV columns, the column
+        # index of each cell (None: they lead the header in order) and the
+        # empty cells for the columns other rows added after them
+        self._live_pids: Optional[Tuple[str, ...]] = None
+        self._live_slots: Optional[Tuple[int, ...]] = None
+        self._live_pad: Tuple[None, ...] = ()
+        self._batch_size: int = 64
+        self._flush_interval_s: Optional[float] = 1.0
+        self._last_flush: float = 0.0
     
-    def start_session(self, format: str = "csv", filename: Optional[str] = None) -> Path:
+    def start_session(
+        self,
+        format: str = "csv",
+        filename: Optional[str] = None,
+        flush_interval: int = 0,
+        batch_size: int = 64,
+        flush_interval_s: Optional[float] = 1.0,
+    ) -> Path:
         """
         Start a new logging session.
         
         Args:
-            format: "csv" or "json"
+            format: "csv" or "json" (rows as NDJSON, summary in a .meta.json sidecar)
             filename: Optional custom filename (without extension)
+            flush_interval: Flush the CSV file every N readings (0 = only on end_session)
+            batch_size: CSV rows buffered in memory before one writerows() call
+            flush_interval_s: Write buffered rows and flush the file at least this
+                often (seconds), so a crash before end_session loses at most that
+                much; None = only on batch_size/flush_interval
             
         Returns:
             Path to the session file
@@ -60,8 +151,14 @@ class SessionLogger:
         self.session_start = cr_now()
         self.reading_count = 0
         self._headers_written = False
-        self._json_data = []
         self._csv_fieldnames = []
+        self._csv_fieldnames_set = set()
+        self._flush_interval = max(0, int(flush_interval))
+        self._row_buffer = []
+        self._live_pids = None
+        self._batch_size = max(1, int(batch_size))
+        self._flush_interval_s = flush_interval_s
+        self._last_flush = time.monotonic()
         
         # Generate filename
         if filename:
@@ -69,12 +166,11 @@ class SessionLogger:
         else:
             base_name = f"session_{cr_timestamp_filename()}"
         
-        ext = ".csv" if self.session_format == "csv" else ".json"
+        ext = ".csv" if self.session_format == "csv" else ".ndjson"
         self.session_file = self.log_dir / f"{base_name}{ext}"
         
-        # Open file for CSV (JSON writes at end)
-        if self.session_format == "csv":
-            self._file_handle = open(self.session_file, "w", newline="", encoding="utf-8")
+        # Both formats stream rows to disk as they arrive
+        self._file_handle = _open_session_file(self.session_file)
         
         return self.session_file
     
@@ -89,21 +185,56 @@ class SessionLogger:
             raise RuntimeError("No active session. Call start_session() first.")
         
         timestamp = cr_timestamp()
-        
-        # Flatten readings to simple dict
-        row = {"timestamp": timestamp}
-        
-        for pid, reading in readings.items():
-            col_name = self._pid_to_column(reading.name)
-            row[col_name] = reading.value
-            row[f"{col_name}_unit"] = reading.unit
-        
-        if self.session_format == "csv":
-            self._write_csv_row(row)
+        pids = tuple(readings)
+
+        if self.session_format == "csv" and pids == self._live_pids:
+            # Same PIDs as the CSV columns: build the row straight in column order
+            slots = self._live_slots
+            if slots is None:
+                values: List[Any] = [timestamp]
+                for reading in readings.values():
+                    values += (reading.value, reading.unit)
+                values += self._live_pad
+            else:
+                values = [None] * len(self._csv_fieldnames)
+                values[slots[0]] = timestamp
+                i = 1
+                for reading in readings.values():
+                    values[slots[i]] = reading.value
+                    values[slots[i + 1]] = reading.unit
+                    i += 2
+            self._buffer_csv_row(tuple(values))
         else:
-            self._json_data.append(row)
+            # Flatten readings to simple dict
+            row = {"timestamp": timestamp}
+            
+            col_cache = self._col_cache
+            for reading in readings.values():
+                keys = col_cache.get(reading.name)
+                if keys is None:
+                    col_name = sys.intern(self._pid_to_column(reading.name))
+                    keys = col_cache[reading.name] = (col_name, sys.intern(f"{col_name}_unit"))
+                row[keys[0]] = reading.value
+                row[keys[1]] = reading.unit
+            
+            if self.session_format == "csv":
+                self._write_csv_row(row)
+                if len(row) == 1 + 2 * len(pids) and row.keys() <= self._csv_fieldnames_set:
+                    self._set_live_columns(pids, row)
+            else:
+                self._write_json_row(row)
         
         self.reading_count += 1
+        if self._file_handle and (
+            (self._flush_interval and self.reading_count % self._flush_interval == 0)
+            or (
+                self._flush_interval_s is not None
+                and time.monotonic() - self._last_flush >= self._flush_interval_s
+            )
+        ):
+            self._drain_rows()
+            self._file_handle.flush()
+            self._last_flush = time.monotonic()
     
     def log_dtcs(self, dtcs: List[Any]) -> None:
         """Log diagnostic trouble codes to the session."""
@@ -124,7 +255,7 @@ class SessionLogger:
             if self.session_format == "csv":
                 self._write_csv_row(row)
             else:
-                self._json_data.append(row)
+                self._write_json_row(row)
     
     def log_freeze_frame(self, freeze_data: Dict[str, Any]) -> None:
         """Log freeze frame data."""
@@ -137,7 +268,7 @@ class SessionLogger:
         if self.session_format == "csv":
             self._write_csv_row(row)
         else:
-            self._json_data.append(row)
+            self._write_json_row(row)
     
     def log_event(self, event_type: str, message: str, data: Optional[Dict] = None) -> None:
         """
@@ -163,30 +294,23 @@ class SessionLogger:
         if self.session_format == "csv":
             self._write_csv_row(row)
         else:
-            self._json_data.append(row)
+            self._write_json_row(row)
     
+    def _set_live_columns(self, pids: Tuple[str, ...], row: Dict[str, Any]) -> None:
+        """Map a live-data row onto the current header for the tuple fast path."""
+        index = {field: i for i, field in enumerate(self._csv_fieldnames)}
+        slots = tuple(index[key] for key in row)
+        if slots == tuple(range(len(slots))):
+            self._live_slots = None
+            self._live_pad = (None,) * (len(index) - len(slots))
+        else:
+            self._live_slots = slots
+            self._live_pad = ()
+        self._live_pids = pids
+
     def _pid_to_column(self, name: str) -> str:
         """Convert PID name to short column name."""
-        mappings = {
-            "Engine Coolant Temperature": "coolant",
-            "Engine RPM": "rpm",
-            "Vehicle Speed": "speed",
-            "Throttle Position": "throttle",
-            "Relative Throttle Position": "throttle_rel",
-            "Accelerator Pedal Position D": "pedal_d",
-            "Accelerator Pedal Position E": "pedal_e",
-            "Control Module Voltage": "voltage",
-            "Intake Manifold Pressure": "map",
-            "Intake Air Temperature": "iat",
-            "Short Term Fuel Trim - Bank 1": "stft_b1",
-            "Long Term Fuel Trim - Bank 1": "ltft_b1",
-            "Calculated Engine Load": "load",
-            "Timing Advance": "timing",
-            "MAF Air Flow Rate": "maf",
-            "Fuel Tank Level": "fuel_level",
-            "Commanded Throttle Actuator": "throttle_cmd",
-        }
-        return mappings.get(name, name.lower().replace(" ", "_")[:20])
+        return _PID_COLUMN_MAP.get(name) or _fallback_colname(name)
     
     def _write_csv_row(self, row: Dict) -> None:
         """Write a row to CSV file."""
@@ -195,21 +319,63 @@ class SessionLogger:
         
         if not self._headers_written:
             self._csv_fieldnames = list(row.keys())
-            self._csv_writer = csv.DictWriter(
-                self._file_handle, 
-                fieldnames=self._csv_fieldnames,
-                extrasaction="ignore"
-            )
-            self._csv_writer.writeheader()
+            self._csv_fieldnames_set = set(self._csv_fieldnames)
+            self._start_csv_writer()
             self._headers_written = True
         
-        new_fields = [key for key in row.keys() if key not in self._csv_fieldnames]
-        if new_fields:
+        # Set difference in C; empty for every steady-state row
+        new_keys = row.keys() - self._csv_fieldnames_set
+        if new_keys:
+            # keep the row's own key order for the new columns
+            new_fields = [key for key in row if key in new_keys]
+            self._drain_rows()
+            self._live_pids = None
             self._rewrite_csv_with_new_fields(new_fields, row)
             return
 
-        self._csv_writer.writerow(row)
-        self._file_handle.flush()
+        self._buffer_csv_row(row)
+
+    def _buffer_csv_row(self, row: Any) -> None:
+        self._row_buffer.append(row)
+        if len(self._row_buffer) >= self._batch_size:
+            self._drain_rows()
+
+    def _drain_rows(self) -> None:
+        """
+        Write buffered CSV rows in one write() call.
+
+        Rows are formatted directly against the fixed column order; only rows
+        with a cell that needs quoting (commas, quotes, newlines - e.g. DTC
+        descriptions) go through the csv writer.
+        """
+        if not self._row_buffer or not self._csv_writer or not self._file_handle:
+            return
+
+        fields = self._csv_fieldnames
+        chunk: List[str] = []
+        for row in self._row_buffer:
+            values = row if type(row) is tuple else map(row.get, fields)
+            cells = ["" if v is None else str(v) for v in values]
+            if _CSV_SPECIAL_RE.search("".join(cells)):
+                if chunk:
+                    self._file_handle.buffer.write("".join(chunk).encode("utf-8"))
+                    chunk = []
+                self._csv_writer.writerow(cells)
+            else:
+                chunk.append(",".join(cells) + "\r\n")
+        if chunk:
+            self._file_handle.buffer.write("".join(chunk).encode("utf-8"))
+        self._row_buffer.clear()
+
+    def _start_csv_writer(self) -> None:
+        """Create a plain csv.writer over the session file and write the header."""
+        self._csv_writer = csv.writer(self._file_handle)
+        self._csv_writer.writerow(self._csv_fieldnames)
+
+    def _write_json_row(self, row: Dict) -> None:
+        """Append one row to the NDJSON session file."""
+        if self._file_handle:
+            self._file_handle.buffer.write(_dumps_row(row) + b"\n")
 
     def _rewrite_csv_with_new_fields(self, new_fields: List[str], row: Dict) -> None:
         if not self.session_file or not self._file_handle:
@@ -219,7 +385,7 @@ class SessionLogger:
         self._file_handle.flush()
         self._file_handle.close()
 
-        updated_fields = self._csv_fieldnames + [f for f in new_fields if f not in self._csv_fieldnames]
+        updated_fields = self._csv_fieldnames + [f for f in new_fields if f not in self._csv_fieldnames_set]
         existing_rows: List[Dict[str, Any]] = []
         try:
             with open(self.session_file, "r", encoding="utf-8", newline="") as f:
@@ -228,19 +394,14 @@ class SessionLogger:
         except FileNotFoundError:
             existing_rows = []
 
-        self._file_handle = open(self.session_file, "w", newline="", encoding="utf-8")
+        self._file_handle = _open_session_file(self.session_file)
         self._csv_fieldnames = updated_fields
-        self._csv_writer = csv.DictWriter(
-            self._file_handle,
-            fieldnames=self._csv_fieldnames,
-            extrasaction="ignore",
-        )
-        self._csv_writer.writeheader()
-
-        for old_row in existing_rows:
-            self._csv_writer.writerow(old_row)
-        self._csv_writer.writerow(row)
-        self._file_handle.flush()
+        self._csv_fieldnames_set = set(updated_fields)
+        self._start_csv_writer()
+
+        fields = self._csv_fieldnames
+        self._csv_writer.writerows([old_row.get(f, "") for f in fields] for old_row in existing_rows)
+        self._csv_writer.writerow([row.get(f, "") for f in fields])
     
     def end_session(self) -> Dict[str, Any]:
         """End the current logging session."""
@@ -259,26 +420,39 @@ class SessionLogger:
             "reading_count": self.reading_count,
         }
         
-        # Write JSON file at end
+        # JSON: rows are already on disk; the summary goes to a sidecar file
         if self.session_format == "json":
-            output = {
-                "session": summary,
-                "data": self._json_data,
-            }
-            with open(self.session_file, "w", encoding="utf-8") as f:
-                json.dump(output, f, indent=2, ensure_ascii=False)
+            meta_file = self.session_file.with_suffix(".meta.json")
+            with open(meta_file, "w", encoding="utf-8") as f:
+                json.dump(summary, f, indent=2, ensure_ascii=False)
         
-        # Close CSV file
+        self.close()
+        return summary
+
+    def close(self) -> None:
+        """
+        Write buffered rows and close the session file without a summary.
+
+        Safe to call more than once; end_session() and __exit__ use it, so rows
+        logged before an exception still reach the disk.
+        """
         if self._file_handle:
+            self._drain_rows()
+            self._file_handle.flush()
             self._file_handle.close()
             self._file_handle = None
         
         # Reset state
         self.session_file = None
         self._csv_writer = None
-        self._json_data = []
-        
-        return summary
+        self._row_buffer = []
+        self._live_pids = None
+
+    def __enter__(self) -> SessionLogger:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
     
     @property
     def is_active(self) -> bool:
@@ -287,9 +461,19 @@ class SessionLogger:
     
     def list_sessions(self) -> List[Path]:
         """List all saved session files."""
-        csv_files = list(self.log_dir.glob("*.csv"))
-        json_files = list(self.log_dir.glob("*.json"))
-        return sorted(csv_files + json_files, reverse=True)
+        if not self.log_dir.is_dir():
+            return []
+        # Single directory pass; skip the .meta.json sidecars of NDJSON sessions
+        with os.scandir(self.log_dir) as it:
+            names = [
+                e.name
+                for e in it
+                if e.name.endswith(_SESSION_SUFFIXES)
+                and not e.name.endswith(".meta.json")
+                and e.is_file()
+            ]
+        names.sort(reverse=True)
+        return [self.log_dir / name for name in names]
 
 
 class QuickLog:
@@ -1,18 +1,43 @@
 from __future__ import annotations
 
+import re
 import time
-from typing import Optional, List, Tuple, Callable
+from typing import Dict, FrozenSet, Optional, List, Set, Tuple, Callable
+
+from app.infrastructure.persistence.data_paths import last_port_path
 
 from ..elm import ELM327
 from ..elm import DeviceDisconnectedError, CommunicationError
 
 from ..protocol import (
-    group_by_ecu,
-    merge_payloads,
+    parse_and_merge,
+    strip_isotp_pci_from_payload,
     find_obd_response_payload,
 )
 
 
+# ELM text that marks a failed/unusable response (one C-level scan per reply).
+# "CAN ERROR" is covered by "ERROR". Case-insensitive so the raw lines are
+# scanned as received, without an upper() copy of the whole reply.
+_ERROR_RE = re.compile(r"NO DATA|UNABLE TO CONNECT|ERROR|STOPPED|BUS|\?|BUFFER FULL", re.IGNORECASE)
+
+
+def _load_last_port() -> Optional[str]:
+    try:
+        return last_port_path().read_text(encoding="utf-8").strip() or None
+    except OSError:
+        return None
+
+
+def _save_last_port(port: str) -> None:
+    try:
+        path = last_port_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(port, encoding="utf-8")
+    except OSError:
+        pass
+
+
 class ScannerError(Exception):
     pass
 
@@ -33,12 +58,16 @@ class BaseScanner:
     - robust query helper (_obd_query_payload)
     """
 
-    ERROR_RESPONSES = {"NO DATA", "ERROR", "NO CONNECT", "INVALID", "DISCONNECTED"}
+    ERROR_RESPONSES = frozenset({"NO DATA", "ERROR", "NO CONNECT", "INVALID", "DISCONNECTED"})
 
-    ECU_PREFER = [
+    ECU_PREFER = (
         "7E8", "7E0", "7E9", "7E1", "7EA", "7E2", "7EB", "7E3",
         "7EC", "7E4", "7ED", "7E5", "7EE", "7E6", "7EF", "7E7"
-    ]
+    )
+
+    # How long a positive adapter liveness check is trusted (per-PID polling
+    # would otherwise query the serial port state on every request).
+    CONN_CHECK_TTL_S = 0.25
 
     def __init__(
         self,
@@ -48,11 +77,54 @@ class BaseScanner:
     ):
         self.elm = ELM327(port=port, baudrate=baudrate, raw_logger=raw_logger)
         self._connected = False
+        self._conn_check_ts = 0.0
+        # Vehicle info that cannot change while connected (protocol, VIN)
+        self._session_info: Dict[str, str] = {}
+        # Mode 01 PIDs the vehicle reports as supported (None: not asked yet)
+        self._supported_pids: Optional[FrozenSet[str]] = None
+        # PIDs missing from the bitmaps that also failed a direct request
+        self._unsupported_pids: Set[str] = set()
+        self._multi_pid_unsupported = False
+        # (monotonic time, 0101 bytes A..D) shared by readiness and MIL status
+        self._status_0101: Tuple[float, bytes] = (0.0, b"")
+
+    def _reset_session_state(self) -> None:
+        """Forget what was learned about the connected vehicle."""
+        self._session_info.clear()
+        self._supported_pids = None
+        self._unsupported_pids = set()
+        self._multi_pid_unsupported = False
+        self._status_0101 = (0.0, b"")
+
+    def _session_protocol(self) -> str:
+        """Protocol name, read once per connection ("" while ATDPN is unknown)."""
+        protocol = self._session_info.get("protocol")
+        if protocol is None:
+            protocol = self.elm.get_protocol()
+            # "Unknown..." may be a transient ATDPN failure; ask again next time
+            if protocol.startswith("Unknown"):
+                return ""
+            self._session_info["protocol"] = protocol
+        return protocol
+
+    def _multi_pid_allowed(self) -> bool:
+        """
+        Whether multi-PID requests are worth sending. They are CAN only
+        (ISO 15765-4), so K-line/J1850 sessions switch them off up front.
+        """
+        if self._multi_pid_unsupported:
+            return False
+        protocol = self._session_protocol()
+        if protocol and "15765" not in protocol:
+            self._multi_pid_unsupported = True
+            return False
+        return True
 
     # -----------------------------
     # Connection
     # -----------------------------
     def connect(self) -> bool:
+        self._reset_session_state()
         self.elm.connect()
         is_ble = str(self.elm.port or "").lower().startswith("ble:")
         connect_timeout = max(self.elm.timeout, 5.0 if is_ble else 8.0)
@@ -95,12 +167,19 @@ class BaseScanner:
         if not ports:
             raise ConnectionError("No USB serial ports found. Is the ELM327 plugged in?")
 
+        # Try the adapter that answered last time first (reordered, not retried)
+        last_port = _load_last_port()
+        if last_port in ports:
+            ports = [last_port] + [p for p in ports if p != last_port]
+
         last_error: Optional[Exception] = None
 
         for port in ports:
             try:
                 self.elm.port = port
                 self.connect()
+                if port != last_port:
+                    _save_last_port(port)
                 return port
             except Exception as e:
                 last_error = e
@@ -113,6 +192,8 @@ class BaseScanner:
 
     def disconnect(self):
         self._connected = False
+        self._conn_check_ts = 0.0
+        self._reset_session_state()
         try:
             self.elm.close()
         except Exception:
@@ -122,9 +203,13 @@ class BaseScanner:
     def is_connected(self) -> bool:
         if not self._connected:
             return False
+        now = time.monotonic()
+        if now - self._conn_check_ts < self.CONN_CHECK_TTL_S:
+            return True
         if not self.elm.is_connected:
             self._connected = False
             return False
+        self._conn_check_ts = now
         return True
 
     def _check_connected(self) -> None:
@@ -133,6 +218,8 @@ class BaseScanner:
 
     def _handle_disconnection(self) -> None:
         self._connected = False
+        self._conn_check_ts = 0.0
+        self._reset_session_state()
 
     # -----------------------------
     # Stage 1 retry wrapper
@@ -143,9 +230,7 @@ class BaseScanner:
             try:
                 lines = self.elm.send_obd_lines(command)
                 last_lines = lines
-                joined = " ".join(lines).upper()
-
-                if not any(err in joined for err in ["NO DATA", "UNABLE TO CONNECT", "ERROR", "STOPPED", "BUS", "CAN ERROR", "?", "BUFFER FULL"]):
+                if not _ERROR_RE.search(" ".join(lines)):
                     return lines
 
             except DeviceDisconnectedError:
@@ -160,7 +245,7 @@ class BaseScanner:
     # -----------------------------
     # Stage 1 robust helper
     # -----------------------------
-    def _obd_query_payload(self, command: str, expected_prefix: List[str]) -> Optional[Tuple[str, List[str]]]:
+    def _obd_query_merged(self, command: str) -> Dict[str, List[str]]:
         self._check_connected()
         try:
             lines = self._send_obd_lines_retry(command, retries=1)
@@ -170,8 +255,24 @@ class BaseScanner:
         except CommunicationError as e:
             raise ScannerError(f"Communication error: {e}")
 
-        grouped = group_by_ecu(lines, headers_on=self.elm.headers_on)
-        merged = merge_payloads(grouped, headers_on=self.elm.headers_on)
+        return parse_and_merge(lines, headers_on=self.elm.headers_on)
+
+    def _obd_query_payload(self, command: str, expected_prefix: List[str]) -> Optional[Tuple[str, List[str]]]:
+        merged = self._obd_query_merged(command)
+
+        prefer = self.ECU_PREFER if self.elm.headers_on else None
+        return find_obd_response_payload(merged, expected_prefix, prefer_ecus=prefer)
+
+    def _obd_query_message(self, command: str, expected_prefix: List[str]) -> Optional[Tuple[str, List[str]]]:
+        """
+        Like _obd_query_payload, but multi-frame ISO-TP replies are reassembled
+        per ECU first, so no consecutive-frame PCI bytes end up inside the data.
+        Single-frame and non-CAN payloads pass through unchanged.
+        """
+        merged = {
+            ecu: strip_isotp_pci_from_payload(payload)
+            for ecu, payload in self._obd_query_merged(command).items()
+        }
 
         prefer = self.ECU_PREFER if self.elm.headers_on else None
         return find_obd_response_payload(merged, expected_prefix, prefer_ecus=prefer)
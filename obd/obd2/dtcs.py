@@ -1,23 +1,66 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 from .models import DiagnosticCode, FreezeFrameData, SensorReading
 from .base import ConnectionLostError, ScannerError
 from ..elm import DeviceDisconnectedError, CommunicationError
 from ..dtc import parse_dtc_response, decode_dtc_bytes
+from ..pids.models import OBDPid
 from ..pids.standard_mode01 import PIDS
-from ..pids.decode import decode_pid_response
+from ..pids.decode import decode_pid_data
 from ..utils import cr_now
 
 
+# Mode 02 freeze-frame PIDs as (pid, info, command prefix), filtered once against PIDS.
+# The request is "02 <PID> <frame>"; the reply echoes it: "42 <PID> <frame> <data...>".
+_FREEZE_FRAME_PIDS: Tuple[Tuple[str, OBDPid, str], ...] = tuple(
+    (pid, PIDS[pid], f"02{pid}")
+    for pid in ("04", "05", "06", "07", "0B", "0C", "0D", "0E", "0F", "11")
+    if pid in PIDS
+)
+
+# (mode, status, expected response header) for stored/pending/permanent DTCs
+_DTC_MODES: Tuple[Tuple[str, str, List[str]], ...] = (
+    ("03", "stored", ["43"]),
+    ("07", "pending", ["47"]),
+    ("0A", "permanent", ["4A"]),
+)
+
+# Mode 02 multi-PID request: "02" + up to 3 (<PID> <frame>) pairs fill one frame.
+_FREEZE_FRAME_BATCH = 3
+
+
+def _split_freeze_frame_payload(
+    payload: List[str], requested: Sequence[str], frame_hex: str
+) -> Iterator[Tuple[str, List[str]]]:
+    """
+    Yield (pid, data_tokens) from a "42 <PID> <frame> <A> [B..] <PID> <frame> ..."
+    payload; stops at the first token that does not fit that layout.
+    """
+    wanted = set(requested)
+    i, n = 1, len(payload)
+    while i + 1 < n:
+        pid = payload[i]
+        if pid == "42" and pid not in wanted:
+            i += 1
+            continue
+        if pid not in wanted or payload[i + 1] != frame_hex:
+            break
+        end = i + 2 + PIDS[pid].bytes
+        if end > n:
+            break
+        yield pid, payload[i + 2 : end]
+        i = end
+
+
 class DtcMixin:
     """
     DTC + Freeze Frame methods.
     Requires BaseScanner providing:
       - _check_connected()
-      - _obd_query_payload()
-      - elm, _handle_disconnection()
+      - _obd_query_payload(), _obd_query_message()
+      - elm, _handle_disconnection(), _multi_pid_allowed()
     Also requires self.dtc_db in concrete class.
     """
 
@@ -28,20 +71,14 @@ class DtcMixin:
         seen: set[str] = set()
         read_time = cr_now()
 
-        modes = [
-            ("03", "stored", ["43"]),
-            ("07", "pending", ["47"]),
-            ("0A", "permanent", ["4A"]),
-        ]
-
         try:
-            for mode, status, prefix in modes:
+            for mode, status, prefix in _DTC_MODES:
                 found = self._obd_query_payload(mode, expected_prefix=prefix)
                 if not found:
                     continue
 
                 ecu, payload = found
-                hex_payload = "".join(payload).upper()
+                hex_payload = "".join(payload)
                 if not hex_payload:
                     continue
 
@@ -73,13 +110,44 @@ class DtcMixin:
             if response == "DISCONNECTED":
                 self._handle_disconnection()
                 raise ConnectionLostError("Device disconnected")
-            return "44" in response.upper()
+            # MIL/DTC count from a cached 0101 reply is stale after a clear
+            self._status_0101 = (0.0, b"")
+            # send_obd already returns upper-case hex (or an upper-case sentinel)
+            return "44" in response
         except DeviceDisconnectedError:
             self._handle_disconnection()
             raise ConnectionLostError("Device disconnected")
         except CommunicationError as e:
             raise ScannerError(f"Communication error: {e}")
 
+    def _read_freeze_frame_batched(self, frame_hex: str) -> Dict[str, Tuple[str, List[str]]]:
+        """
+        Mode 02 multi-PID requests ("02 0C 00 0D 00 05 00"): pid -> (ecu, data tokens).
+
+        Stops batching after the first request that does not return more than
+        one PID (ECU without multi-PID support); the caller reads the rest alone.
+        If the first request is answered with a single PID, batching is switched
+        off for the connection.
+        """
+        out: Dict[str, Tuple[str, List[str]]] = {}
+
+        for start in range(0, len(_FREEZE_FRAME_PIDS), _FREEZE_FRAME_BATCH):
+            chunk = [pid for pid, _info, _prefix in _FREEZE_FRAME_PIDS[start : start + _FREEZE_FRAME_BATCH]]
+            if len(chunk) < 2:
+                break
+            found = self._obd_query_message("02" + "".join(pid + frame_hex for pid in chunk), expected_prefix=["42"])
+            decoded = 0
+            if found:
+                ecu, payload = found
+                for pid, data_tokens in _split_freeze_frame_payload(payload, chunk, frame_hex):
+                    out.setdefault(pid, (ecu, data_tokens))
+                    decoded += 1
+            if decoded < 2:
+                if found and start == 0:
+                    self._multi_pid_unsupported = True
+                break
+        return out
+
     def read_freeze_frame(self, frame_number: int = 0) -> Optional[FreezeFrameData]:
         """
         Pragmatic freeze-frame reader:
@@ -94,31 +162,42 @@ class DtcMixin:
             # NOTE: Many ECUs don't provide the freeze-frame DTC in a consistent way via OBD Mode 02.
             # We'll keep it Unknown unless you later validate a working query on a specific vehicle/ECU.
 
-            freeze_pids = ["04", "05", "06", "07", "0B", "0C", "0D", "0E", "0F", "11"]
+            frame_hex = f"{frame_number:02X}"
+            read_time = cr_now()
+            data_by_pid: Dict[str, Tuple[str, List[str]]] = {}
+            batch_failed = False
+            if self._multi_pid_allowed():
+                data_by_pid = self._read_freeze_frame_batched(frame_hex)
+                # Batch unanswered: only a single read answering tells whether
+                # the ECU ignores multi-PID requests or just has no frame stored
+                batch_failed = not data_by_pid
+
             readings: dict[str, SensorReading] = {}
 
-            for pid in freeze_pids:
-                pid = pid.upper()
-                pid_info = PIDS.get(pid)
-                if not pid_info:
-                    continue
+            for pid, pid_info, prefix in _FREEZE_FRAME_PIDS:
+                if pid in data_by_pid:
+                    ecu, data_tokens = data_by_pid[pid]
+                else:
+                    # Not in a batched reply: ask for this PID alone
+                    found = self._obd_query_payload(prefix + frame_hex, expected_prefix=["42", pid, frame_hex])
+                    if not found:
+                        continue
 
-                found = self._obd_query_payload(f"02{pid}", expected_prefix=["42", pid])
-                if not found:
-                    continue
+                    ecu, payload = found
+                    if not payload or len(payload) < 4:
+                        continue
 
-                ecu, payload = found
-                if not payload or len(payload) < 3:
-                    continue
+                    # payload example: ["42", "<PID>", "<frame>", "<A>", "<B>", ...]
+                    data_tokens = payload[3:]
+                    if batch_failed:
+                        self._multi_pid_unsupported = True
+                        batch_failed = False
 
-                # payload example: ["42", "<PID>", "<A>", "<B>", ...]
-                if payload[0].upper() != "42" or payload[1].upper() != pid:
+                data_hex = "".join(data_tokens)
+                try:
+                    value = decode_pid_data(pid_info, bytes.fromhex(data_hex))
+                except ValueError:
                     continue
-
-                data_tokens = payload[2:]
-                data_hex = "".join(data_tokens).upper()
-
-                value = decode_pid_response(pid, data_hex)
                 if value is None:
                     continue
 
@@ -128,7 +207,7 @@ class DtcMixin:
                     unit=pid_info.unit,
                     pid=pid,
                     raw_hex=data_hex,
-                    timestamp=cr_now(),
+                    timestamp=read_time,
                     ecu=ecu,  # remove if SensorReading doesn't support ecu
                 )
 
@@ -138,7 +217,7 @@ class DtcMixin:
             return FreezeFrameData(
                 dtc_code=dtc_code,
                 readings=readings,
-                timestamp=cr_now(),
+                timestamp=read_time,
             )
 
         except DeviceDisconnectedError:
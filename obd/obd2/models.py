@@ -4,10 +4,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Optional
 
-from ..utils import cr_now
+from ..utils import DATACLASS_SLOTS, cr_now
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SensorReading:
     name: str
     value: Optional[float]
@@ -16,25 +16,33 @@ class SensorReading:
     raw_hex: str
     ecu: Optional[str] = None
     timestamp: datetime = field(default_factory=cr_now)
+    # timestamp_str, formatted on first access (timestamp is set once at creation)
+    _timestamp_str: str = field(default="", init=False, repr=False, compare=False)
 
     @property
     def timestamp_str(self) -> str:
-        return self.timestamp.strftime("%Y-%m-%d %H:%M:%S")
+        if not self._timestamp_str:
+            self._timestamp_str = self.timestamp.strftime("%Y-%m-%d %H:%M:%S")
+        return self._timestamp_str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DiagnosticCode:
     code: str
     description: str
     status: str  # "stored", "pending", "permanent"
     timestamp: datetime = field(default_factory=cr_now)
+    # timestamp_str, formatted on first access (timestamp is set once at creation)
+    _timestamp_str: str = field(default="", init=False, repr=False, compare=False)
 
     @property
     def timestamp_str(self) -> str:
-        return self.timestamp.strftime("%Y-%m-%d %H:%M:%S")
+        if not self._timestamp_str:
+            self._timestamp_str = self.timestamp.strftime("%Y-%m-%d %H:%M:%S")
+        return self._timestamp_str
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ReadinessStatus:
     monitor_name: str
     available: bool
@@ -47,7 +55,7 @@ class ReadinessStatus:
         return "Complete" if self.complete else "Incomplete"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FreezeFrameData:
     dtc_code: str
     readings: Dict[str, SensorReading]
@@ -1,90 +1,110 @@
 from __future__ import annotations
 
+import time
 from typing import Dict, Tuple
 
 from .models import ReadinessStatus
 
 
+# Mode 01 PID 01 as one 32-bit word: A<<24 | B<<16 | C<<8 | D.
+# Each monitor is (name, supported mask, incomplete mask) over that word.
+def _b(bit: int) -> int:
+    return 1 << (16 + bit)
+
+
+def _c(bit: int) -> int:
+    return 1 << (8 + bit)
+
+
+def _d(bit: int) -> int:
+    return 1 << bit
+
+
+_MIL_MASK = 0x80 << 24
+_DIESEL_MASK = _b(3)
+
+_SPARK_MONITORS: Tuple[Tuple[str, int, int], ...] = (
+    # continuous: supported in B, incomplete in C
+    ("Misfire", _b(0), _c(0)),
+    ("Fuel System", _b(1), _c(1)),
+    ("Components", _b(2), _c(2)),
+    # non-continuous: supported in B/C, incomplete in D
+    ("Catalyst", _b(4), _d(0)),
+    ("Heated Catalyst", _b(5), _d(1)),
+    ("Evaporative System", _b(6), _d(2)),
+    ("Secondary Air", _b(7), _d(3)),
+    ("A/C Refrigerant", _c(3), _d(4)),
+    ("Oxygen Sensor", _c(4), _d(5)),
+    ("Oxygen Sensor Heater", _c(5), _d(6)),
+    ("EGR System", _c(6), _d(7)),
+)
+
+_DIESEL_MONITORS: Tuple[Tuple[str, int, int], ...] = (
+    ("NMHC Catalyst", _c(0), _d(0)),
+    ("NOx/SCR Aftertreatment", _c(1), _d(1)),
+    ("Boost Pressure", _c(3), _d(3)),
+    ("Exhaust Gas Sensor", _c(5), _d(5)),
+    ("PM Filter", _c(6), _d(6)),
+    ("EGR/VVT System", _c(7), _d(7)),
+)
+
+
 class ReadinessMixin:
-    def read_readiness(self) -> Dict[str, ReadinessStatus]:
-        self._check_connected()
+    # read_readiness() and get_mil_status() both decode the 0101 reply;
+    # get_vehicle_info() right after a readiness read reuses it for this long.
+    STATUS_0101_TTL_S = 0.5
+
+    def _read_0101(self) -> bytes:
+        """
+        Bytes A..D of the 0101 reply (fewer if truncated, b"" on failure).
+        Only a complete reply is cached; a truncated one is asked again.
+        """
+        ts, raw = getattr(self, "_status_0101", (0.0, b""))
+        now = time.monotonic()
+        if raw and now - ts < self.STATUS_0101_TTL_S:
+            return raw
 
         found = self._obd_query_payload("0101", expected_prefix=["41", "01"])
         if not found:
-            return {}
+            return b""
 
         ecu, payload = found
-        if len(payload) < 6:
-            return {}
-
         try:
-            A = int(payload[2], 16)
-            B = int(payload[3], 16)
-            C = int(payload[4], 16)
-            D = int(payload[5], 16)
+            raw = bytes.fromhex("".join(payload[2:6]))
         except ValueError:
+            return b""
+        if len(raw) == 4:
+            self._status_0101 = (now, raw)
+        return raw
+
+    def read_readiness(self) -> Dict[str, ReadinessStatus]:
+        self._check_connected()
+
+        raw = self._read_0101()
+        if len(raw) != 4:
             return {}
+        word = int.from_bytes(raw, "big")
 
         monitors: Dict[str, ReadinessStatus] = {}
 
-        mil_on = bool(A & 0x80)
+        mil_on = bool(word & _MIL_MASK)
         monitors["MIL (Check Engine Light)"] = ReadinessStatus("MIL (Check Engine Light)", True, not mil_on)
 
-        is_spark = not bool(B & 0x08)
-
-        if is_spark:
-            cont = [("Misfire", 0), ("Fuel System", 1), ("Components", 2)]
-            for name, bit in cont:
-                supported = bool(B & (1 << bit))
-                incomplete = bool(C & (1 << bit))
-                monitors[name] = ReadinessStatus(name, supported, (not incomplete) if supported else False)
-
-            noncont = [
-                ("Catalyst", ("B", 4), 0),
-                ("Heated Catalyst", ("B", 5), 1),
-                ("Evaporative System", ("B", 6), 2),
-                ("Secondary Air", ("B", 7), 3),
-                ("A/C Refrigerant", ("C", 3), 4),
-                ("Oxygen Sensor", ("C", 4), 5),
-                ("Oxygen Sensor Heater", ("C", 5), 6),
-                ("EGR System", ("C", 6), 7),
-            ]
-            for name, (src, bit), d_bit in noncont:
-                supported = bool((B if src == "B" else C) & (1 << bit))
-                incomplete = bool(D & (1 << d_bit))
-                monitors[name] = ReadinessStatus(name, supported, (not incomplete) if supported else False)
-
-        else:
-            diesel = [
-                ("NMHC Catalyst", ("C", 0), 0),
-                ("NOx/SCR Aftertreatment", ("C", 1), 1),
-                ("Boost Pressure", ("C", 3), 3),
-                ("Exhaust Gas Sensor", ("C", 5), 5),
-                ("PM Filter", ("C", 6), 6),
-                ("EGR/VVT System", ("C", 7), 7),
-            ]
-            for name, (_src, bit), d_bit in diesel:
-                supported = bool(C & (1 << bit))
-                incomplete = bool(D & (1 << d_bit))
-                monitors[name] = ReadinessStatus(name, supported, (not incomplete) if supported else False)
+        table = _DIESEL_MONITORS if word & _DIESEL_MASK else _SPARK_MONITORS
+        for name, supported_mask, incomplete_mask in table:
+            supported = bool(word & supported_mask)
+            incomplete = bool(word & incomplete_mask)
+            monitors[name] = ReadinessStatus(name, supported, (not incomplete) if supported else False)
 
         return monitors
 
     def get_mil_status(self) -> Tuple[bool, int]:
         self._check_connected()
 
-        found = self._obd_query_payload("0101", expected_prefix=["41", "01"])
-        if not found:
-            return (False, 0)
-
-        ecu, payload = found
-        if len(payload) < 3:
-            return (False, 0)
-
-        try:
-            A = int(payload[2], 16)
-        except ValueError:
+        raw = self._read_0101()
+        if not raw:
             return (False, 0)
+        A = raw[0]
 
         mil_on = bool(A & 0x80)
         dtc_count = A & 0x7F
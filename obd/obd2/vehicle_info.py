@@ -7,43 +7,77 @@ from .base import ConnectionLostError
 from ..protocol import (
     extract_ascii_from_hex_tokens,
     is_valid_vin,
-    strip_isotp_pci_from_payload,
 )
 
 
+def _vin_tokens_after_header(tokens: List[str]) -> List[str]:
+    """Tokens after the first "49 02 01" header (list.index jumps between "49" candidates)."""
+    stop = len(tokens) - 3
+    start = 0
+    while start < stop:
+        try:
+            i = tokens.index("49", start, stop)
+        except ValueError:
+            return []
+        if tokens[i + 1] == "02" and tokens[i + 2] == "01":
+            return tokens[i + 3:]
+        start = i + 1
+    return []
+
+
 class VehicleInfoMixin:
+    """
+    Requires BaseScanner's _session_info dict: protocol, ELM version and VIN
+    are read once per connection, MIL status is always read live.
+    """
+
+    def _read_vin_info(self) -> Dict[str, str]:
+        # Frames are reassembled per ECU before the "49 02" search, so no
+        # consecutive-frame PCI byte is left inside the VIN
+        found = self._obd_query_message("0902", expected_prefix=["49", "02"])
+        if not found:
+            return {}
+        ecu, payload = found
+
+        vin_tokens = _vin_tokens_after_header(payload)
+        if not vin_tokens:
+            vin_tokens = payload[3:] if len(payload) > 3 else []
+
+        vin = extract_ascii_from_hex_tokens(vin_tokens).strip().upper()
+        out = {"vin_raw": "".join(payload)}
+
+        if len(vin) >= 17:
+            vin = vin[:17]
+
+        if is_valid_vin(vin):
+            out["vin"] = vin
+            out["vin_ecu"] = ecu
+        return out
+
     def get_vehicle_info(self) -> Dict[str, str]:
         self._check_connected()
 
+        cached = self._session_info
         info: Dict[str, str] = {}
         try:
-            info["protocol"] = self.elm.get_protocol()
+            if "protocol" in cached:
+                info["protocol"] = cached["protocol"]
+            else:
+                info["protocol"] = self.elm.get_protocol()
+                # "Unknown..." may be a transient ATDPN failure; ask again next time
+                if not info["protocol"].startswith("Unknown"):
+                    cached["protocol"] = info["protocol"]
             info["elm_version"] = self.elm.elm_version or "unknown"
             info["headers_mode"] = "ON" if self.elm.headers_on else "OFF"
 
-            found = self._obd_query_payload("0902", expected_prefix=["49", "02"])
-            if found:
-                ecu, payload = found
-
-                cleaned = strip_isotp_pci_from_payload(payload)
-
-                vin_tokens: List[str] = []
-                for i in range(0, max(0, len(cleaned) - 3)):
-                    if cleaned[i:i+3] == ["49", "02", "01"]:
-                        vin_tokens = cleaned[i+3:]
-                        break
-                if not vin_tokens:
-                    vin_tokens = cleaned[3:] if len(cleaned) > 3 else []
-
-                vin = extract_ascii_from_hex_tokens(vin_tokens).strip().upper()
-                info["vin_raw"] = "".join(payload)
-
-                if len(vin) >= 17:
-                    vin = vin[:17]
-
-                if is_valid_vin(vin):
-                    info["vin"] = vin
-                    info["vin_ecu"] = ecu
+            if "vin" in cached:
+                vin_info = {k: cached[k] for k in ("vin_raw", "vin", "vin_ecu")}
+            else:
+                vin_info = self._read_vin_info()
+                # A truncated/garbled reply (lost frame) is retried next call
+                if "vin" in vin_info:
+                    cached.update(vin_info)
+            info.update(vin_info)
 
             mil_on, dtc_count = self.get_mil_status()
             info["mil_on"] = "Yes" if mil_on else "No"
@@ -1,17 +1,19 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Optional, Union
 
+from .models import OBDPid
 from .standard_mode01 import PIDS
 
 
-def decode_pid_response(pid: str, hex_data: str) -> Optional[float]:
+def decode_pid_response(pid: str, hex_data: Union[str, bytes]) -> Optional[float]:
     """
-    Decode Mode 01 PID response data using the PID's formula.
+    Decode Mode 01 PID response data using the PID's affine formula.
 
     Args:
         pid: PID code (e.g., "05")
-        hex_data: data bytes only, as hex string, no spaces (e.g., "7B")
+        hex_data: data bytes only, either raw bytes (e.g., b"\x7b") or a hex
+            string without spaces (e.g., "7B")
 
     Returns:
         float value or None
@@ -21,18 +23,32 @@ def decode_pid_response(pid: str, hex_data: str) -> Optional[float]:
         return None
 
     pid_info = PIDS[pid]
+    if isinstance(hex_data, bytes):
+        return decode_pid_data(pid_info, hex_data)
 
+    n = pid_info.bytes
+    if len(hex_data) < 2 * n:
+        return None
     try:
-        if pid_info.bytes == 1 and len(hex_data) >= 2:
-            a = int(hex_data[0:2], 16)
-            return pid_info.formula(a)
+        data = bytes.fromhex(hex_data[: 2 * n])
+    except (ValueError, TypeError):
+        return None
+    return decode_pid_data(pid_info, data)
 
-        if pid_info.bytes == 2 and len(hex_data) >= 4:
-            a = int(hex_data[0:2], 16)
-            b = int(hex_data[2:4], 16)
-            return pid_info.formula(a, b)
 
-    except (ValueError, TypeError):
+def decode_pid_data(pid_info: OBDPid, data: bytes) -> Optional[float]:
+    """
+    decode_pid_response() for callers that already hold the PIDS entry:
+    no PID normalization or registry lookup.
+    """
+    ka, kb, offset, divisor = pid_info.affine
+
+    n = pid_info.bytes
+    if n not in (1, 2) or len(data) < n:
         return None
 
-    return None
+    raw = data[0] * ka + offset
+    if n == 2:
+        raw += data[1] * kb
+
+    return raw if divisor == 1 else raw / divisor
@@ -1,17 +1,37 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple, Union
 
+from ..utils import DATACLASS_SLOTS
 
-@dataclass(frozen=True)
+Number = Union[int, float]
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class OBDPid:
-    """Represents an OBD-II Parameter ID (Mode 01)."""
+    """
+    Represents an OBD-II Parameter ID (Mode 01).
+
+    Every standard Mode 01 formula is affine in the data bytes, so it is stored
+    as ``affine = (ka, kb, offset, divisor)``:
+    ``value = (A * ka + B * kb + offset) / divisor`` (integer result when divisor is 1).
+    """
     pid: str
     name: str
     unit: str
     bytes: int
-    formula: Callable
+    affine: Tuple[int, int, int, int]
     min_value: Optional[float] = None
     max_value: Optional[float] = None
     description: Optional[str] = None
+
+    def evaluate(self, a: int, b: int = 0) -> Number:
+        ka, kb, offset, divisor = self.affine
+        raw = a * ka + b * kb + offset
+        return raw if divisor == 1 else raw / divisor
+
+    @property
+    def formula(self) -> Callable[..., Number]:
+        """Callable form of the affine formula (``formula(a)`` / ``formula(a, b)``)."""
+        return self.evaluate
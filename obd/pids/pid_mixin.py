@@ -1,12 +1,169 @@
 # obd/obd2/pid_mixin.py
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Optional, Sequence
+import asyncio
+from datetime import datetime
+from typing import AsyncIterator, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple
 
+from ..pids.models import OBDPid
 from ..pids.standard_mode01 import PIDS
-from ..pids.decode import decode_pid_response
+from ..pids.decode import decode_pid_data
 from ..pids.sets import DIAGNOSTIC_PIDS
 from ..obd2.models import SensorReading
+from ..utils import cr_now
+
+# Mode 01 accepts up to 6 PIDs per request (ISO 15765-4).
+MULTI_PID_MAX = 6
+# Keep each batched reply inside one CAN single frame ("41" + 6 bytes), so
+# ISO-TP consecutive-frame PCI bytes never land in the middle of PID data.
+_SINGLE_FRAME_DATA_BYTES = 6
+
+
+# (pid, info, command, expected_prefix) per Mode 01 PID, built once at import
+_PidQuery = Tuple[str, OBDPid, str, List[str]]
+_PID_QUERIES: Dict[str, _PidQuery] = {
+    pid: (pid, info, f"01{pid}", ["41", pid]) for pid, info in PIDS.items()
+}
+# Default live-data set, already normalized and filtered to known PIDs
+_DIAG_PRECOMP: Tuple[_PidQuery, ...] = tuple(
+    _PID_QUERIES[pid] for pid in DIAGNOSTIC_PIDS if pid in _PID_QUERIES
+)
+_DIAG_NORMALIZED: Tuple[str, ...] = tuple(query[0] for query in _DIAG_PRECOMP)
+
+
+# "Supported PIDs" bitmap PIDs: each answers 4 bytes covering the next 32 PIDs;
+# its lowest bit says whether the following bitmap PID exists.
+_SUPPORT_BITMAP_PIDS = ("00", "20", "40", "60", "80", "A0", "C0")
+
+
+def _bitmap_word(merged: Dict[str, List[str]], bitmap_pid: str) -> Optional[int]:
+    """
+    OR of every "41 <bitmap_pid> A B C D" in the reply, across all ECUs (and
+    across replies run together when headers are off). None if none answered.
+    """
+    word: Optional[int] = None
+    for payload in merged.values():
+        last = len(payload) - 6
+        start = 0
+        while start <= last:
+            try:
+                i = payload.index("41", start, last + 1)
+            except ValueError:
+                break
+            if payload[i + 1] == bitmap_pid:
+                try:
+                    raw = bytes.fromhex("".join(payload[i + 2 : i + 6]))
+                except ValueError:
+                    raw = b""
+                if len(raw) == 4:
+                    word = (word or 0) | int.from_bytes(raw, "big")
+                    start = i + 6
+                    continue
+            start = i + 1
+    return word
+
+
+def _pids_from_bitmap(base: int, word: int) -> Tuple[List[str], bool]:
+    """(PIDs base+1..base+32 flagged in the bitmap, whether base+0x20 is supported)."""
+    pids = [f"{base + i:02X}" for i in range(1, 33) if word & (1 << (32 - i))]
+    return pids, bool(word & 1)
+
+
+def _pack_single_frame(pids: Sequence[str]) -> List[List[str]]:
+    """Group known PIDs, in order, into requests whose reply fits one frame."""
+    chunks: List[List[str]] = []
+    current: List[str] = []
+    used = 0
+    for pid in pids:
+        size = 1 + PIDS[pid].bytes
+        if current and (len(current) == MULTI_PID_MAX or used + size > _SINGLE_FRAME_DATA_BYTES):
+            chunks.append(current)
+            current, used = [], 0
+        current.append(pid)
+        used += size
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _split_multi_pid_payload(
+    payload: List[str], requested: Sequence[str]
+) -> Iterator[Tuple[str, List[str]]]:
+    """
+    Yield (pid, data_tokens) from a "41 <PID> <A> [B..] <PID> <A> ..." payload.
+
+    The ECU omits PIDs it does not support, so the walk is driven by the PID
+    byte sizes and stops at the first token that is not a requested PID.
+    """
+    wanted = set(requested)
+    seen = set()
+    i, n = 1, len(payload)
+    while i < n:
+        pid = payload[i]
+        if pid == "41" and pid not in wanted:
+            # Next response header (headers off: replies are merged together)
+            i += 1
+            continue
+        if pid not in wanted:
+            break
+        end = i + 1 + PIDS[pid].bytes
+        if end > n:
+            break
+        if pid not in seen:
+            seen.add(pid)
+            yield pid, payload[i + 1 : end]
+        i = end
+
+
+def _build_pid_aliases() -> Dict[str, str]:
+    aliases: Dict[str, str] = {}
+    for pid in PIDS:
+        spellings = [pid, pid.lower()]
+        if pid[0] == "0":
+            spellings += [pid[1], pid[1].lower()]
+        for alias in spellings:
+            aliases[alias] = pid
+    return aliases
+
+
+# Every spelling accepted for a known PIDS key ("0C", "0c", "C", "c") -> "0C"
+_PID_ALIASES: Dict[str, str] = _build_pid_aliases()
+
+
+def _normalize_pid(pid: str) -> str:
+    """Canonical "0C" form; known PIDs resolve with a single dict lookup."""
+    canonical = _PID_ALIASES.get(pid)
+    if canonical is not None:
+        return canonical
+    pid = pid.strip().upper()
+    # Normalize "0C" vs "C"
+    if len(pid) == 1:
+        pid = "0" + pid
+    return pid
+
+
+def _live_pid_lists(pids: Optional[Sequence[str]], dedupe: bool) -> Tuple[List[str], List[str]]:
+    """(normalized PIDs in request order, the subset known to PIDS)."""
+    if pids is None or pids is DIAGNOSTIC_PIDS:
+        # Default set: already normalized, deduped and known
+        normalized = list(_DIAG_NORMALIZED)
+        return normalized, normalized
+
+    # Dedupe while preserving order
+    normalized = []
+    seen = set()
+    for p in pids:
+        if p is None:
+            continue
+        p = _normalize_pid(p)
+        if not p:
+            continue
+        if dedupe:
+            if p in seen:
+                continue
+            seen.add(p)
+        normalized.append(p)
+    return normalized, [pid for pid in normalized if pid in PIDS]
 
 
 class PidMixin:
@@ -17,6 +174,10 @@ class PidMixin:
       - _obd_query_payload(command: str, expected_prefix: List[str])
           -> Optional[tuple[str, List[str]]]
             where payload tokens look like: ["41", "<PID>", "<A>", "<B>", ...]
+      - _obd_query_merged(command: str) -> Dict[str, List[str]]
+            (payload tokens per ECU, for replies every ECU answers)
+      - _multi_pid_allowed() -> bool
+            (False on non-CAN sessions or once batching was switched off)
     """
 
     def read_pid(
@@ -38,19 +199,76 @@ class PidMixin:
         if pid is None:
             return None
 
-        pid = pid.strip().upper()
-        if not pid:
+        query = _PID_QUERIES.get(_normalize_pid(pid))
+        if not query:
             return None
+        # Skip only PIDs already confirmed missing (bitmaps and a direct request)
+        if query[0] in (getattr(self, "_unsupported_pids", None) or ()):
+            return None
+        reading = self._read_pid_fast(*query, round_to=round_to, allow_empty=allow_empty)
+        supported = getattr(self, "_supported_pids", None)
+        if supported and query[0] not in supported:
+            self._record_unlisted_pid(query[0], reading is not None)
+        return reading
 
-        # Normalize "0C" vs "C"
-        if len(pid) == 1:
-            pid = "0" + pid
+    def _record_unlisted_pid(self, pid: str, answered: bool) -> None:
+        """
+        A PID the bitmaps do not list was requested anyway: trust the vehicle.
+        An answer adds it to the supported set; no answer marks it unsupported
+        for the rest of the connection.
+        """
+        if answered:
+            self._supported_pids = self._supported_pids | {pid}
+            return
+        unsupported = getattr(self, "_unsupported_pids", None)
+        if unsupported is None:
+            unsupported = self._unsupported_pids = set()
+        unsupported.add(pid)
 
-        pid_info = PIDS.get(pid)
-        if not pid_info:
-            return None
+    def get_supported_pids(self) -> FrozenSet[str]:
+        """
+        Mode 01 PIDs the vehicle reports via the 0100/0120/... bitmaps (union
+        over every ECU that answers), read once per connection. Empty if the
+        bitmaps could not be read (then nothing is pruned); that is not cached,
+        so a later refresh asks again once the bus is awake.
+        """
+        cached = getattr(self, "_supported_pids", None)
+        if cached is not None:
+            return cached
+
+        supported: List[str] = []
+        for bitmap_pid in _SUPPORT_BITMAP_PIDS:
+            # Every ECU answers with its own bitmap; a PID counts if any ECU has it
+            word = _bitmap_word(self._obd_query_merged("01" + bitmap_pid), bitmap_pid)
+            if word is None:
+                break
+            if bitmap_pid == "00":
+                # 0100 itself answered, so it is supported too
+                supported.append("00")
+            pids, more = _pids_from_bitmap(int(bitmap_pid, 16), word)
+            supported.extend(pids)
+            if not more:
+                break
 
-        found = self._obd_query_payload(f"01{pid}", expected_prefix=["41", pid])
+        if not supported:
+            # 0100 unanswered (bus waking up, transient NO DATA/timeout)
+            return frozenset()
+        self._supported_pids = frozenset(supported)
+        return self._supported_pids
+
+    def _read_pid_fast(
+        self,
+        pid: str,
+        pid_info: OBDPid,
+        command: str,
+        expected_prefix: List[str],
+        *,
+        round_to: int,
+        allow_empty: bool,
+        timestamp: Optional[datetime] = None,
+    ) -> Optional[SensorReading]:
+        """read_pid() body for an already normalized, known PID."""
+        found = self._obd_query_payload(command, expected_prefix=expected_prefix)
         if not found:
             return None
 
@@ -59,14 +277,35 @@ class PidMixin:
             return None
 
         # Defensive: ensure it actually matches what we expect
-        # payload example: ["41", "0C", "1A", "F8"]
-        if payload[0].upper() != "41" or payload[1].upper() != pid:
+        # payload example: ["41", "0C", "1A", "F8"] (normalize_tokens: uppercase hex)
+        if payload[0] != "41" or payload[1] != pid:
             return None
 
-        data_tokens = payload[2:]
-        data_hex = "".join(t.strip() for t in data_tokens if t and t.strip()).upper()
+        return self._reading_from_tokens(
+            pid, pid_info, payload[2:], ecu,
+            round_to=round_to, allow_empty=allow_empty, timestamp=timestamp,
+        )
 
-        value = decode_pid_response(pid, data_hex)
+    def _reading_from_tokens(
+        self,
+        pid: str,
+        pid_info: OBDPid,
+        data_tokens: List[str],
+        ecu: str,
+        *,
+        round_to: int,
+        allow_empty: bool,
+        timestamp: Optional[datetime] = None,
+    ) -> Optional[SensorReading]:
+        """timestamp: shared read time for a batch (defaults to now)."""
+        # Tokens are already stripped, uppercase hex (normalize_tokens)
+        data_hex = "".join(data_tokens)
+        try:
+            data = bytes.fromhex(data_hex)
+        except ValueError:
+            value = None
+        else:
+            value = decode_pid_data(pid_info, data)
 
         if value is None and not allow_empty:
             return None
@@ -88,8 +327,155 @@ class PidMixin:
             pid=pid,
             raw_hex=data_hex,
             ecu=ecu,
+            timestamp=timestamp or cr_now(),
+        )
+
+    def _iter_pids_batched(
+        self, chunks: Sequence[List[str]], *, round_to: int, timestamp: Optional[datetime] = None
+    ) -> Iterator[SensorReading]:
+        """
+        Read PIDs with multi-PID Mode 01 requests ("01 0C 0D 05 ..."), one per
+        chunk, yielding each reading as its reply is decoded.
+
+        PIDs missing from the result are left to the caller's single-PID path.
+        If requests were answered but none with more than one PID, batching is
+        switched off for this scanner (adapter/ECU without multi-PID support).
+        No answer at all is settled by the caller once the single reads are in.
+        """
+        batched_ok = False
+        answered = False
+        for chunk in chunks:
+            found = self._obd_query_payload("01" + "".join(chunk), expected_prefix=["41"])
+            if not found:
+                continue
+            answered = True
+            ecu, payload = found
+            decoded = 0
+            for pid, data_tokens in _split_multi_pid_payload(payload, chunk):
+                decoded += 1
+                reading = self._reading_from_tokens(
+                    pid, PIDS[pid], data_tokens, ecu,
+                    round_to=round_to, allow_empty=False, timestamp=timestamp,
+                )
+                if reading:
+                    yield reading
+            batched_ok = batched_ok or decoded > 1
+        if answered and not batched_ok:
+            self._multi_pid_unsupported = True
+
+    def _iter_live_data(
+        self,
+        normalized: List[str],
+        known: List[str],
+        *,
+        round_to: int,
+        stop_on_error: bool,
+    ) -> Iterator[SensorReading]:
+        try:
+            supported = self.get_supported_pids()
+        except Exception:
+            if stop_on_error:
+                raise
+            supported = frozenset()
+        if supported:
+            # Batch only what the bitmaps list. A PID they leave out still gets
+            # one single request per connection; only if that fails too is it
+            # skipped from then on (see _record_unlisted_pid).
+            rejected = getattr(self, "_unsupported_pids", None) or ()
+            normalized = [pid for pid in normalized if pid not in rejected]
+            known = [pid for pid in known if pid in supported]
+
+        # One timestamp for the whole refresh
+        read_time = cr_now()
+        batched: set = set()
+
+        # PIDs sent in a multi-PID request (a PID packed alone is read singly)
+        batch_sent: set = set()
+
+        if len(known) > 1 and self._multi_pid_allowed():
+            chunks = [chunk for chunk in _pack_single_frame(known) if len(chunk) > 1]
+            batch_sent = {pid for chunk in chunks for pid in chunk}
+            try:
+                for reading in self._iter_pids_batched(chunks, round_to=round_to, timestamp=read_time):
+                    batched.add(reading.pid)
+                    yield reading
+            except Exception:
+                if stop_on_error:
+                    raise
+        # A single read answering what no batch did: the ECU ignores (NO DATA)
+        # multi-PID requests, so stop sending them. Nothing answering at all
+        # (bus still waking up) proves nothing.
+        batch_failed = bool(batch_sent) and not batched
+
+        for pid in normalized:
+            if pid in batched:
+                continue
+            query = _PID_QUERIES.get(pid)
+            if not query:
+                continue
+            try:
+                reading = self._read_pid_fast(
+                    *query, round_to=round_to, allow_empty=False, timestamp=read_time
+                )
+            except Exception:
+                if stop_on_error:
+                    raise
+                # continue scanning even if one PID breaks
+                continue
+            if supported and pid not in supported:
+                self._record_unlisted_pid(pid, reading is not None)
+            if reading:
+                if batch_failed and pid in batch_sent:
+                    self._multi_pid_unsupported = True
+                    batch_failed = False
+                yield reading
+
+    def read_live_data_stream(
+        self,
+        pids: Optional[Sequence[str]] = None,
+        *,
+        round_to: int = 2,
+        dedupe: bool = True,
+        stop_on_error: bool = False,
+    ) -> Iterator[SensorReading]:
+        """
+        Like read_live_data(), but yields each SensorReading as soon as it is
+        decoded (batched replies first, then single-PID reads) instead of
+        returning a dict at the end. Lets a UI redraw incrementally or stop a
+        refresh early.
+        """
+        normalized, known = _live_pid_lists(pids, dedupe)
+        yield from self._iter_live_data(
+            normalized, known, round_to=round_to, stop_on_error=stop_on_error
         )
 
+    async def aread_live_data(
+        self,
+        pids: Optional[Sequence[str]] = None,
+        *,
+        round_to: int = 2,
+        dedupe: bool = True,
+        stop_on_error: bool = False,
+    ) -> AsyncIterator[SensorReading]:
+        """
+        Async read_live_data_stream() ("async for r in scanner.aread_live_data()").
+
+        Each step (serial round trip + decode) runs in the default executor, so
+        the event loop keeps redrawing/serving other tasks while the adapter
+        answers. The ELM327 is half-duplex with one command in flight, so the
+        requests themselves are still sent one after another.
+        """
+        loop = asyncio.get_running_loop()
+        stream = self.read_live_data_stream(
+            pids, round_to=round_to, dedupe=dedupe, stop_on_error=stop_on_error
+        )
+        done = object()
+        while True:
+            reading = await loop.run_in_executor(None, next, stream, done)
+            if reading is done:
+                return
+            yield reading
+
     def read_live_data(
         self,
         pids: Optional[Sequence[str]] = None,
@@ -108,40 +494,15 @@ class PidMixin:
           - if True, raises exceptions (useful in tests)
           - if False, continues scanning and skips failures
         """
-        pid_list: Iterable[str] = pids if pids is not None else DIAGNOSTIC_PIDS
-
-        # Dedupe while preserving order
-        normalized: List[str] = []
-        seen = set()
-
-        for p in pid_list:
-            if p is None:
-                continue
-            p = p.strip().upper()
-            if not p:
-                continue
-            if len(p) == 1:
-                p = "0" + p
-            if dedupe:
-                if p in seen:
-                    continue
-                seen.add(p)
-            normalized.append(p)
-
-        results: Dict[str, SensorReading] = {}
-
-        for pid in normalized:
-            try:
-                reading = self.read_pid(pid, round_to=round_to)
-                if reading:
-                    results[pid] = reading
-            except Exception:
-                if stop_on_error:
-                    raise
-                # continue scanning even if one PID breaks
-                continue
-
-        return results
+        normalized, known = _live_pid_lists(pids, dedupe)
+        results: Dict[str, SensorReading] = {
+            reading.pid: reading
+            for reading in self._iter_live_data(
+                normalized, known, round_to=round_to, stop_on_error=stop_on_error
+            )
+        }
 
+        # Keep the requested order regardless of which path read each PID
+        return {pid: results[pid] for pid in normalized if pid in results}
 
 __all__ = ["PidMixin"]
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import Dict, Mapping
+
 from .models import OBDPid
 
 # Mode 01 - Live Data PIDs
-PIDS = {
+_PIDS_RAW: Dict[str, OBDPid] = {
     "04": OBDPid(
         pid="04",
         name="Calculated Engine Load",
         unit="%",
         bytes=1,
-        formula=lambda a: (a * 100) / 255,
+        affine=(100, 0, 0, 255),
         min_value=0,
         max_value=100,
         description="Indicates percentage of peak available torque",
@@ -19,7 +22,7 @@ PIDS = {
         name="Engine Coolant Temperature",
         unit="°C",
         bytes=1,
-        formula=lambda a: a - 40,
+        affine=(1, 0, -40, 1),
         min_value=-40,
         max_value=215,
         description="Coolant temperature from ECT sensor",
@@ -29,7 +32,7 @@ PIDS = {
         name="Intake Air Temperature",
         unit="°C",
         bytes=1,
-        formula=lambda a: a - 40,
+        affine=(1, 0, -40, 1),
         min_value=-40,
         max_value=215,
         description="Air temperature entering the engine",
@@ -39,7 +42,7 @@ PIDS = {
         name="Engine Oil Temperature",
         unit="°C",
         bytes=1,
-        formula=lambda a: a - 40,
+        affine=(1, 0, -40, 1),
         min_value=-40,
         max_value=215,
         description="Oil temperature (if supported)",
@@ -49,7 +52,7 @@ PIDS = {
         name="Short Term Fuel Trim - Bank 1",
         unit="%",
         bytes=1,
-        formula=lambda a: (a - 128) * 100 / 128,
+        affine=(100, 0, -12800, 128),
         min_value=-100,
         max_value=99.2,
         description="Immediate fuel adjustment (+ = adding fuel)",
@@ -59,7 +62,7 @@ PIDS = {
         name="Long Term Fuel Trim - Bank 1",
         unit="%",
         bytes=1,
-        formula=lambda a: (a - 128) * 100 / 128,
+        affine=(100, 0, -12800, 128),
         min_value=-100,
         max_value=99.2,
         description="Learned fuel adjustment (+ = adding fuel)",
@@ -69,7 +72,7 @@ PIDS = {
         name="Short Term Fuel Trim - Bank 2",
         unit="%",
         bytes=1,
-        formula=lambda a: (a - 128) * 100 / 128,
+        affine=(100, 0, -12800, 128),
         min_value=-100,
         max_value=99.2,
         description="Immediate fuel adjustment bank 2",
@@ -79,7 +82,7 @@ PIDS = {
         name="Long Term Fuel Trim - Bank 2",
         unit="%",
         bytes=1,
-        formula=lambda a: (a - 128) * 100 / 128,
+        affine=(100, 0, -12800, 128),
         min_value=-100,
         max_value=99.2,
         description="Learned fuel adjustment bank 2",
@@ -89,7 +92,7 @@ PIDS = {
         name="Fuel Pressure",
         unit="kPa",
         bytes=1,
-        formula=lambda a: a * 3,
+        affine=(3, 0, 0, 1),
         min_value=0,
         max_value=765,
         description="Fuel rail pressure (gauge)",
@@ -99,7 +102,7 @@ PIDS = {
         name="Intake Manifold Pressure",
         unit="kPa",
         bytes=1,
-        formula=lambda a: a,
+        affine=(1, 0, 0, 1),
         min_value=0,
         max_value=255,
         description="MAP sensor reading",
@@ -109,7 +112,7 @@ PIDS = {
         name="Engine RPM",
         unit="rpm",
         bytes=2,
-        formula=lambda a, b: ((a * 256) + b) / 4,
+        affine=(256, 1, 0, 4),
         min_value=0,
         max_value=16383.75,
         description="Current engine speed",
@@ -119,7 +122,7 @@ PIDS = {
         name="Vehicle Speed",
         unit="km/h",
         bytes=1,
-        formula=lambda a: a,
+        affine=(1, 0, 0, 1),
         min_value=0,
         max_value=255,
         description="Current vehicle speed",
@@ -129,7 +132,7 @@ PIDS = {
         name="Timing Advance",
         unit="°",
         bytes=1,
-        formula=lambda a: (a / 2) - 64,
+        affine=(1, 0, -128, 2),
         min_value=-64,
         max_value=63.5,
         description="Ignition timing advance for #1 cylinder",
@@ -139,7 +142,7 @@ PIDS = {
         name="MAF Air Flow Rate",
         unit="g/s",
         bytes=2,
-        formula=lambda a, b: ((a * 256) + b) / 100,
+        affine=(256, 1, 0, 100),
         min_value=0,
         max_value=655.35,
         description="Mass air flow sensor reading",
@@ -149,7 +152,7 @@ PIDS = {
         name="Throttle Position",
         unit="%",
         bytes=1,
-        formula=lambda a: (a * 100) / 255,
+        affine=(100, 0, 0, 255),
         min_value=0,
         max_value=100,
         description="Absolute throttle position",
@@ -159,7 +162,7 @@ PIDS = {
         name="Relative Throttle Position",
         unit="%",
         bytes=1,
-        formula=lambda a: (a * 100) / 255,
+        affine=(100, 0, 0, 255),
         min_value=0,
         max_value=100,
         description="Relative throttle position",
@@ -169,7 +172,7 @@ PIDS = {
         name="Absolute Throttle Position B",
         unit="%",
         bytes=1,
-        formula=lambda a: (a * 100) / 255,
+        affine=(100, 0, 0, 255),
         min_value=0,
         max_value=100,
         description="Throttle position sensor B",
@@ -179,7 +182,7 @@ PIDS = {
         name="Commanded Throttle Actuator",
         unit="%",
         bytes=1,
-        formula=lambda a: (a * 100) / 255,
+        affine=(100, 0, 0, 255),
         min_value=0,
         max_value=100,
         description="Commanded throttle actuator position",
@@ -189,7 +192,7 @@ PIDS = {
         name="Accelerator Pedal Position D",
         unit="%",
         bytes=1,
-        formula=lambda a: (a * 100) / 255,
+        affine=(100, 0, 0, 255),
         min_value=0,
         max_value=100,
         description="Accelerator pedal position sensor D",
@@ -199,7 +202,7 @@ PIDS = {
         name="Accelerator Pedal Position E",
         unit="%",
         bytes=1,
-        formula=lambda a: (a * 100) / 255,
+        affine=(100, 0, 0, 255),
         min_value=0,
         max_value=100,
         description="Accelerator pedal position sensor E",
@@ -209,7 +212,7 @@ PIDS = {
         name="Run Time Since Engine Start",
         unit="sec",
         bytes=2,
-        formula=lambda a, b: (a * 256) + b,
+        affine=(256, 1, 0, 1),
         min_value=0,
         max_value=65535,
         description="Time since engine start",
@@ -219,7 +222,7 @@ PIDS = {
         name="Fuel Tank Level",
         unit="%",
         bytes=1,
-        formula=lambda a: (a * 100) / 255,
+        affine=(100, 0, 0, 255),
         min_value=0,
         max_value=100,
         description="Fuel tank level input",
@@ -229,7 +232,7 @@ PIDS = {
         name="Control Module Voltage",
         unit="V",
         bytes=2,
-        formula=lambda a, b: ((a * 256) + b) / 1000,
+        affine=(256, 1, 0, 1000),
         min_value=0,
         max_value=65.535,
         description="ECU supply voltage",
@@ -239,7 +242,7 @@ PIDS = {
         name="O2 Sensor 1 Voltage",
         unit="V",
         bytes=2,
-        formula=lambda a, b: a / 200,
+        affine=(1, 0, 0, 200),
         min_value=0,
         max_value=1.275,
         description="Bank 1 Sensor 1 O2 voltage",
@@ -249,9 +252,12 @@ PIDS = {
         name="O2 Sensor 2 Voltage",
         unit="V",
         bytes=2,
-        formula=lambda a, b: a / 200,
+        affine=(1, 0, 0, 200),
         min_value=0,
         max_value=1.275,
         description="Bank 1 Sensor 2 O2 voltage",
     ),
 }
+
+# Read-only view: the table is pure data and must not be patched at runtime.
+PIDS: Mapping[str, OBDPid] = MappingProxyType(_PIDS_RAW)
@@ -1,6 +1,6 @@
 # obd/protocol/__init__.py
 from .normalize import normalize_tokens
-from .ecu import group_by_ecu, merge_payloads, find_obd_response_payload
+from .ecu import group_by_ecu, merge_payloads, parse_and_merge, find_obd_response_payload
 from .payload import payload_from_tokens
 from .isotp import strip_isotp_pci_from_payload
 from .ascii import extract_ascii_from_hex_tokens, is_valid_vin
@@ -9,6 +9,7 @@ __all__ = [
     "normalize_tokens",
     "group_by_ecu",
     "merge_payloads",
+    "parse_and_merge",
     "find_obd_response_payload",
     "payload_from_tokens",
     "strip_isotp_pci_from_payload",
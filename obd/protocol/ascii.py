@@ -1,21 +1,42 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import List
 
 VIN_RE = re.compile(r"^[A-HJ-NPR-Z0-9]{17}$")  # excluye I,O,Q
 
-def extract_ascii_from_hex_tokens(tokens: List[str]) -> str:
-    s = ""
-    for t in tokens or []:
+# Bytes fuera de ASCII imprimible (32..126), se borran con translate
+_NONPRINT = bytes(b for b in range(256) if b < 32 or b > 126)
+
+def _extract_ascii_slow(tokens: List[str]) -> str:
+    buf: List[str] = []
+    for t in tokens:
         try:
             b = int(t, 16)
         except Exception:
             continue
         if 32 <= b <= 126:
-            s += chr(b)
-    return s
+            buf.append(chr(b))
+    return "".join(buf)
+
+def extract_ascii_from_hex_tokens(tokens: List[str]) -> str:
+    if not tokens:
+        return ""
+    # Camino rápido: todos los tokens son bytes de 2 dígitos hex
+    if all(len(t) == 2 for t in tokens):
+        try:
+            data = bytes.fromhex("".join(tokens))
+        except ValueError:
+            pass
+        else:
+            return data.translate(None, _NONPRINT).decode("ascii")
+    return _extract_ascii_slow(tokens)
+
+# El mismo VIN se valida en cada consulta/poll; caché acotado
+@lru_cache(maxsize=128)
+def _vin_valid(vin_upper: str) -> bool:
+    return VIN_RE.match(vin_upper) is not None
 
 def is_valid_vin(vin: str) -> bool:
-    vin = (vin or "").strip().upper()
-    return bool(VIN_RE.match(vin))
+    return _vin_valid((vin or "").strip().upper())
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from .normalize import is_noise, normalize_tokens, is_hexish_tokens
-from .payload import payload_from_tokens
+from .normalize import is_noise, normalize_tokens
+from .payload import payload_start
 
-def group_by_ecu(lines: List[str], headers_on: bool = True) -> Dict[str, List[List[str]]]:
+# Por ECU: (tokens de todas sus líneas en una lista plana, offset de inicio de cada línea)
+EcuLines = Tuple[List[str], List[int]]
+
+def group_by_ecu(lines: List[str], headers_on: bool = True) -> Dict[str, EcuLines]:
     """
     Retorna:
-      ecu -> [ [tokens_line1], [tokens_line2], ... ]
+      ecu -> (tokens_planos, [offset_linea1, offset_linea2, ...])
     """
-    out: Dict[str, List[List[str]]] = {}
+    out: Dict[str, EcuLines] = {}
     for ln in lines or []:
         if not ln:
             continue
@@ -18,32 +22,67 @@ def group_by_ecu(lines: List[str], headers_on: bool = True) -> Dict[str, List[Li
             continue
 
         tokens = normalize_tokens(ln)
-        if not tokens or not is_hexish_tokens(tokens):
+        if not tokens:
             continue
 
-        if headers_on:
-            ecu = tokens[0]
-            out.setdefault(ecu, []).append(tokens)
-        else:
-            out.setdefault("NOHDR", []).append(tokens)
+        ecu = tokens[0] if headers_on else "NOHDR"
+        entry = out.get(ecu)
+        if entry is None:
+            entry = out[ecu] = ([], [])
+        flat, offsets = entry
+        offsets.append(len(flat))
+        flat += tokens
     return out
 
-def merge_payloads(grouped: Dict[str, List[List[str]]], headers_on: bool = True) -> Dict[str, List[str]]:
+def merge_payloads(grouped: Dict[str, EcuLines], headers_on: bool = True) -> Dict[str, List[str]]:
     """
     Aplana todas las líneas por ECU en un solo payload (lista de tokens hex).
     """
     merged: Dict[str, List[str]] = {}
-    for ecu, msgs in (grouped or {}).items():
+    for ecu, (flat, offsets) in (grouped or {}).items():
         out: List[str] = []
-        for msg in msgs:
-            out.extend(payload_from_tokens(msg, headers_on=headers_on))
+        ends = offsets[1:] + [len(flat)]
+        for start, end in zip(offsets, ends):
+            out += flat[payload_start(flat, start, end, headers_on):end]
         merged[ecu] = out
     return merged
 
+def parse_and_merge(lines: List[str], headers_on: bool = True) -> Dict[str, List[str]]:
+    """
+    group_by_ecu + merge_payloads en un solo pase: cada línea se tokeniza y su
+    data se agrega directo al payload plano de su ECU.
+
+    No corta al encontrar un prefijo: el payload de respuesta sigue en las
+    líneas siguientes del mismo ECU (multi-frame).
+    """
+    merged: Dict[str, List[str]] = {}
+    for ln in lines or []:
+        if not ln or is_noise(ln):
+            continue
+
+        tokens = normalize_tokens(ln)
+        if not tokens:
+            continue
+
+        ecu = tokens[0] if headers_on else "NOHDR"
+        out = merged.get(ecu)
+        if out is None:
+            out = merged[ecu] = []
+        out += tokens[payload_start(tokens, 0, len(tokens), headers_on):]
+    return merged
+
+# Un vehículo responde siempre con el mismo conjunto de ECUs: el orden de
+# búsqueda se calcula una vez por (ECUs presentes, preferencia)
+@lru_cache(maxsize=64)
+def _ecu_order(present: Tuple[str, ...], prefer: Tuple[str, ...]) -> Tuple[str, ...]:
+    preferred = [e for e in prefer if e in present]
+    rest = [e for e in present if e not in preferred]
+    return tuple(preferred + rest)
+
 def find_obd_response_payload(
     merged_payloads: Dict[str, List[str]],
     expected_prefix: List[str],
-    prefer_ecus: Optional[List[str]] = None,
+    prefer_ecus: Optional[Sequence[str]] = None,
 ) -> Optional[Tuple[str, List[str]]]:
     """
     Busca el ECU cuyo payload contenga el prefijo esperado (ej: ["41","0C"]).
@@ -52,19 +91,31 @@ def find_obd_response_payload(
     if not merged_payloads or not expected_prefix:
         return None
 
-    ecu_order = list(merged_payloads.keys())
-
-    if prefer_ecus:
-        preferred = [e for e in prefer_ecus if e in merged_payloads]
-        rest = [e for e in ecu_order if e not in preferred]
-        ecu_order = preferred + rest
+    ecu_order: Sequence[str] = tuple(merged_payloads)
+    # Con un solo ECU no hay preferencia que aplicar
+    if prefer_ecus and len(ecu_order) > 1:
+        ecu_order = _ecu_order(ecu_order, tuple(prefer_ecus))
 
     n = len(expected_prefix)
+    first = expected_prefix[0]
+    tail = list(expected_prefix[1:])
+    head = [first] + tail
     for ecu in ecu_order:
         payload = merged_payloads.get(ecu, [])
-        if len(payload) < n:
+        last = len(payload) - n
+        if last < 0:
             continue
-        for i in range(0, len(payload) - n + 1):
-            if payload[i : i + n] == expected_prefix:
+        # Caso común: la respuesta empieza directamente con el prefijo
+        if payload[:n] == head:
+            return ecu, payload[:]
+        # Saltar con list.index (en C) a cada candidato del primer byte
+        start = 0
+        while True:
+            try:
+                i = payload.index(first, start, last + 1)
+            except ValueError:
+                break
+            if payload[i + 1 : i + n] == tail:
                 return ecu, payload[i:]
+            start = i + 1
     return None
@@ -2,57 +2,53 @@ from __future__ import annotations
 
 from typing import List
 
-def strip_isotp_pci_from_payload(payload: List[str]) -> List[str]:
+# Frame CAN clásico tal como lo imprime el ELM: PCI + datos = 8 bytes
+_CAN_FRAME_BYTES = 8
+
+def strip_isotp_pci_bytes(data: bytes) -> bytes:
     """
-    Limpieza ISO-TP mínima pero más correcta:
-    - Single Frame: 0x0L (drop 1 byte PCI)
-    - First Frame:  0x1? + len byte (drop 2 bytes)
-    - Consecutive:  0x2? (drop 1 byte)
-    - Flow control: 0x3? (drop 3 bytes típicamente, pero aquí ignoramos el frame completo)
+    Reensambla un mensaje ISO-TP desde frames CAN concatenados (empezando en
+    un byte PCI) y devuelve solo los datos:
+    - Single Frame: 0x0L (L bytes de datos)
+    - First Frame:  0x1L + LL (largo total de 12 bits, 6 bytes de datos)
+    - Consecutive:  0x2N (hasta 7 bytes de datos)
+    - Flow control: 0x3? (se descarta el frame completo)
+    Si data no empieza con un PCI de SF/FF se devuelve tal cual.
     """
-    out: List[str] = []
-    i = 0
-    n = len(payload or [])
-
-    while i < n:
-        t = (payload[i] or "").upper()
-        if len(t) != 2:
-            # Si no es byte, lo dejamos pasar
-            out.append(t)
-            i += 1
-            continue
-
-        try:
-            b = int(t, 16)
-        except ValueError:
-            out.append(t)
-            i += 1
-            continue
-
-        frame_type = (b & 0xF0) >> 4  # high nibble
-
-        # 0x0? Single frame (1 byte PCI)
-        if frame_type == 0x0:
-            i += 1
-            continue
-
-        # 0x1? First frame (2 bytes PCI: 1? + length)
-        if frame_type == 0x1:
-            i += 2
-            continue
-
-        # 0x2? Consecutive frame (1 byte PCI)
+    n = len(data)
+    if not n:
+        return b""
+
+    b = data[0]
+    frame_type = b >> 4
+    if frame_type == 0x0:
+        return data[1 : 1 + (b & 0x0F)]
+    if frame_type != 0x1 or n < 2:
+        return data
+
+    total = ((b & 0x0F) << 8) | data[1]
+    out = bytearray(data[2:_CAN_FRAME_BYTES])
+    i = _CAN_FRAME_BYTES
+    while i < n and len(out) < total:
+        frame_type = data[i] >> 4
+        end = min(i + _CAN_FRAME_BYTES, n)
         if frame_type == 0x2:
-            i += 1
-            continue
-
-        # 0x3? Flow control: generalmente no queremos esos bytes
-        if frame_type == 0x3:
-            # lo más seguro: saltar este byte y los siguientes 2 si existen
-            i += 3
-            continue
-
-        out.append(t)
-        i += 1
+            out += data[i + 1 : end]
+        elif frame_type != 0x3:
+            # Fuera de sincronía: no inventar datos
+            break
+        i = end
+    return bytes(out[:total])
 
-    return out
+def strip_isotp_pci_from_payload(payload: List[str]) -> List[str]:
+    """
+    Versión por tokens de strip_isotp_pci_bytes. Los tokens que no son un
+    byte (índices de línea del ELM, "0:" -> "0") se descartan.
+    """
+    hex_str = "".join(t for t in payload or [] if len(t) == 2)
+    try:
+        data = bytes.fromhex(hex_str)
+    except ValueError:
+        return [t.upper() for t in payload if len(t) == 2]
+    out = strip_isotp_pci_bytes(data).hex().upper()
+    return [out[i : i + 2] for i in range(0, len(out), 2)]
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import re
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 HEXISH_RE = re.compile(r"^[0-9A-Fa-f ]+$")
+TOKEN_RE = re.compile(r"[0-9A-F]+")
 
 # Prefijos ruidosos típicos de ELM / adaptadores
 NOISE_PREFIXES = (
@@ -19,20 +21,24 @@ NOISE_PREFIXES = (
     "DATA ERROR",
 )
 
-def is_noise(line: str) -> bool:
-    up = (line or "").strip().upper()
-    if not up:
-        return True
+# Un solo match en C: prefijos ruidosos, banner ELM327 y "OK" como línea suelta
+NOISE_RE = re.compile(
+    "^(?:" + "|".join(re.escape(p) for p in NOISE_PREFIXES) + "|ELM327|OK$)"
+)
 
-    # OK como línea suelta
-    if up == "OK":
-        return True
+# Las capturas ELM repiten muchas líneas (flow control, mismos frames por ECU)
+@lru_cache(maxsize=4096)
+def _is_noise_cached(line: str) -> bool:
+    up = line.strip().upper()
+    return not up or NOISE_RE.match(up) is not None
 
-    # ELM327 version banners
-    if up.startswith("ELM327"):
-        return True
+def is_noise(line: str) -> bool:
+    return _is_noise_cached(line or "")
 
-    return any(up.startswith(p) for p in NOISE_PREFIXES)
+@lru_cache(maxsize=4096)
+def _normalize_cached(line: str) -> Tuple[str, ...]:
+    # Un solo pase: los tokens salen hex por construcción
+    return tuple(TOKEN_RE.findall(line.upper()))
 
 def normalize_tokens(line: str) -> List[str]:
     """
@@ -40,10 +46,9 @@ def normalize_tokens(line: str) -> List[str]:
     """
     if not line:
         return []
-    clean = re.sub(r"[^0-9A-Fa-f ]", "", line)
-    return [t.upper() for t in clean.split() if t]
+    # Copia: el caché guarda tuplas y el llamador puede mutar la lista
+    return list(_normalize_cached(line))
 
 def is_hexish_tokens(tokens: List[str]) -> bool:
-    if not tokens:
-        return False
-    return bool(HEXISH_RE.match(" ".join(tokens)))
+    # Invariante: los tokens salen de normalize_tokens (TOKEN_RE), ya son hex
+    return bool(tokens)
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from typing import List
 
-def payload_from_tokens(tokens: List[str], headers_on: bool = True) -> List[str]:
+def payload_start(tokens: List[str], start: int, end: int, headers_on: bool = True) -> int:
     """
+    Índice donde empieza la data de la línea tokens[start:end] (sin copiarla).
+
     CAN típico con headers:
       <ECU> <LEN?> <DATA...>
     Sin headers:
@@ -13,25 +15,30 @@ def payload_from_tokens(tokens: List[str], headers_on: bool = True) -> List[str]
     - Solo intenta si rest[0] parece byte hex válido
     - Y si "encaja" con la cantidad de bytes que vienen después
     """
-    if not tokens:
-        return []
-
-    rest = tokens[1:] if headers_on else tokens[:]
-    if not rest:
-        return []
+    rest = start + 1 if headers_on else start
+    if rest >= end:
+        return end
 
     # drop "LEN" si encaja
-    ln_tok = rest[0]
+    ln_tok = tokens[rest]
     if len(ln_tok) in (1, 2):
         try:
             ln = int(ln_tok, 16)
-            remaining = len(rest) - 1
+            remaining = end - rest - 1
             # Heurística conservadora:
             # - ln > 0
             # - ln <= remaining (encaja exacto o al menos plausible)
             if 0 < ln <= remaining:
-                return rest[1:]
+                return rest + 1
         except ValueError:
             pass
 
     return rest
+
+def payload_from_tokens(tokens: List[str], headers_on: bool = True) -> List[str]:
+    """
+    Data de una línea ya tokenizada (ver payload_start).
+    """
+    if not tokens:
+        return []
+    return tokens[payload_start(tokens, 0, len(tokens), headers_on):]
@@ -1,6 +1,6 @@
 import time
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, List, Optional
 
 from app.infrastructure.persistence.data_paths import logs_dir
 
@@ -9,10 +9,39 @@ class RawLogger:
         default_path = logs_dir() / "obd_raw.log"
         self.path = Path(path) if path else default_path
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Opened once on first use, appended to in binary mode
+        self._fh: Optional[BinaryIO] = None
+        # strftime only once per second
+        self._last_ts_sec = -1
+        self._last_ts = b""
+
+    def _timestamp(self) -> bytes:
+        sec = int(time.time())
+        if sec != self._last_ts_sec:
+            self._last_ts = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec)).encode("ascii")
+            self._last_ts_sec = sec
+        return self._last_ts
 
     def __call__(self, direction: str, command: str, lines: List[str]):
-        ts = time.strftime("%Y-%m-%d %H:%M:%S")
-        with self.path.open("a", encoding="utf-8") as f:
-            f.write(f"[{ts}] {direction} {command}\n")
-            for ln in lines:
-                f.write(f"  {ln}\n")
+        buf = bytearray(b"[")
+        buf += self._timestamp()
+        buf += f"] {direction} {command}\n".encode("utf-8")
+        for ln in lines:
+            buf += f"  {ln}\n".encode("utf-8")
+
+        if self._fh is None or self._fh.closed:
+            self._fh = self.path.open("ab", buffering=1 << 16)
+        # One write per exchange; flush so the log survives a crash mid-scan
+        self._fh.write(buf)
+        self._fh.flush()
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
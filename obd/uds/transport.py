@@ -3,12 +3,13 @@ from __future__ import annotations
 from typing import List, Optional
 
 from ..elm import ELM327, CommunicationError, DeviceDisconnectedError
-from ..protocol import group_by_ecu, merge_payloads
+from ..protocol import parse_and_merge
 from .exceptions import UdsTransportError
 
 
 def _hex_bytes(data: bytes) -> str:
-    return " ".join(f"{b:02X}" for b in data)
+    # One C-level pass instead of an f-string per byte
+    return data.hex(" ").upper()
 
 
 def _tokens_to_bytes(tokens: List[str]) -> bytes:
@@ -61,8 +62,7 @@ class UdsTransport:
         except (CommunicationError, DeviceDisconnectedError) as exc:
             raise UdsTransportError(str(exc))
 
-        grouped = group_by_ecu(lines, headers_on=self.headers_on)
-        merged = merge_payloads(grouped, headers_on=self.headers_on)
+        merged = parse_and_merge(lines, headers_on=self.headers_on)
 
         if self.headers_on:
             tokens = merged.get(self.rx_id) or next(iter(merged.values()), [])
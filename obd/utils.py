@@ -2,6 +2,8 @@
 OBD-II Scanner Utilities (compat shim).
 """
 
+import sys
+
 from app.application.time_utils import (
     APP_NAME,
     CR_TZ,
@@ -12,7 +14,11 @@ from app.application.time_utils import (
     cr_timestamp_filename,
 )
 
+# dataclass(**DATACLASS_SLOTS): __slots__ on 3.10+, plain dataclass on older Pythons
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 __all__ = [
+    "DATACLASS_SLOTS",
     "CR_TZ",
     "VERSION",
     "APP_NAME",
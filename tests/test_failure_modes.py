@@ -70,6 +70,43 @@ class FailureModeTests(unittest.TestCase):
         readiness = scanner.read_readiness()
         self.assertEqual({}, readiness)
 
+    def test_readiness_partial_frame_is_not_cached(self) -> None:
+        steps = [
+            {"command": "0101", "lines": ["41 01 80 07"]},
+            {"command": "0101", "lines": ["41 01 80 07 A0 13"]},
+        ]
+        scanner = self._scanner_with_steps(steps)
+        self.assertEqual({}, scanner.read_readiness())
+        self.assertTrue(scanner.read_readiness())
+
+    @staticmethod
+    def _freeze_frame_single_steps() -> List[Dict[str, object]]:
+        # Only 04 has a stored value; every other PID gets NO DATA (and one retry)
+        steps: List[Dict[str, object]] = [{"command": "020400", "lines": ["42 04 00 80"]}]
+        for pid in ("05", "06", "07", "0B", "0C", "0D", "0E", "0F", "11"):
+            steps += [{"command": f"02{pid}00", "lines": ["NO DATA"]}] * 2
+        return steps
+
+    def test_freeze_frame_skips_multi_pid_on_kline(self) -> None:
+        steps = [{"command": "ATDPN", "lines": ["A3"]}] + self._freeze_frame_single_steps()
+        scanner = self._scanner_with_steps(steps)
+        frame = scanner.read_freeze_frame()
+        self.assertEqual(["04"], list(frame.readings))
+        self.assertFalse(scanner.elm.connection._steps)  # pylint: disable=protected-access
+
+    def test_freeze_frame_stops_batching_after_ignored_request(self) -> None:
+        steps = (
+            [{"command": "ATDPN", "lines": ["A6"]}]
+            + [{"command": "020400050006 00", "lines": ["NO DATA"]}] * 2
+            + self._freeze_frame_single_steps()
+            # Second read: no multi-PID request before the single reads
+            + self._freeze_frame_single_steps()
+        )
+        scanner = self._scanner_with_steps(steps)
+        self.assertEqual(["04"], list(scanner.read_freeze_frame().readings))
+        self.assertEqual(["04"], list(scanner.read_freeze_frame().readings))
+        self.assertFalse(scanner.elm.connection._steps)  # pylint: disable=protected-access
+
     def test_timeout_raises_scanner_error(self) -> None:
         steps = [
             {"command": "0101", "error": "timeout"},
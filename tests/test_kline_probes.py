@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import unittest
+
+from typing import List, Optional
+
+from obd.kline.profiles.iso9141_2 import ISO9141_2
+from obd.kline.runtime.policy import KLinePolicy
+from obd.kline.runtime.probes import extract_hex_blob, looks_like_hex, probe_ok
+from obd.kline.runtime.routing import query_profile
+
+_HEXSET = frozenset("0123456789ABCDEF")
+
+
+class KLineProbeTests(unittest.TestCase):
+    def test_extract_hex_blob_is_hex_only(self) -> None:
+        blob = extract_hex_blob(["48 6B 10 41 00 BE 3E B8 11 C9", "SEARCHING...", "bus init: ok"])
+        self.assertTrue(blob)
+        self.assertTrue(all(c in _HEXSET for c in blob))
+
+    def test_extract_hex_blob_uppercases_in_translate(self) -> None:
+        self.assertEqual(extract_hex_blob(["41 0c 1a f8"]), "410C1AF8")
+
+    def test_looks_like_hex_relies_on_extract_invariant(self) -> None:
+        self.assertTrue(looks_like_hex(extract_hex_blob(["41 0C 1A F8"])))
+        self.assertFalse(looks_like_hex(extract_hex_blob(["?", ">"])))
+
+    def test_probe_ok_matches_mode01_0100(self) -> None:
+        self.assertTrue(probe_ok("0100", ["48 6B 10 41 00 BE 3E B8 11 C9"]))
+        self.assertFalse(probe_ok("0100", ["NO DATA"]))
+        self.assertFalse(probe_ok("0100", []))
+
+
+class _CountElm:
+    """Fake ELM: answers "?" to a response-count request unless it supports it."""
+
+    def __init__(self, version: Optional[str], count_ok: bool) -> None:
+        self.elm_version = version
+        self.count_ok = count_ok
+        self.sent: List[str] = []
+
+    def send_raw_lines(self, cmd: str, timeout: Optional[float] = None) -> List[str]:
+        self.sent.append(cmd)
+        if " " in cmd and not self.count_ok:
+            return ["?"]
+        return ["48 6B 10 41 00 BE 3E B8 11 C9"]
+
+
+_FAST_POLICY = KLinePolicy(skip_initial_settle=True, backoff_s=0.0)
+
+
+class KLineResponseCountTests(unittest.TestCase):
+    def _query(self, elm: _CountElm) -> List[str]:
+        return query_profile(elm, "0100", profile=ISO9141_2, base_policy=_FAST_POLICY)
+
+    def test_count_suffix_only_from_v1_3(self) -> None:
+        new = _CountElm("ELM327 v1.5", count_ok=True)
+        old = _CountElm("ELM327 v1.2", count_ok=False)
+        self.assertTrue(probe_ok("0100", self._query(new)))
+        self.assertTrue(probe_ok("0100", self._query(old)))
+        self.assertEqual(new.sent, ["0100 1"])
+        self.assertEqual(old.sent, ["0100"])
+
+    def test_clone_rejecting_count_falls_back_to_bare_command(self) -> None:
+        clone = _CountElm("ELM327 v1.5", count_ok=False)
+        self.assertTrue(probe_ok("0100", self._query(clone)))
+        self.assertTrue(probe_ok("0100", self._query(clone)))
+        # "?" once, then the bare command is remembered for this adapter
+        self.assertEqual(clone.sent, ["0100 1", "0100", "0100"])
+
+    def test_short_reply_without_question_mark_keeps_count(self) -> None:
+        elm = _CountElm("ELM327 v1.5", count_ok=True)
+        first = True
+
+        def send_raw_lines(cmd: str, timeout: Optional[float] = None) -> List[str]:
+            nonlocal first
+            if first:
+                # Truncated frame: "invalid" for analyze_response, but no "?"
+                first = False
+                elm.sent.append(cmd)
+                return ["41 00"]
+            return _CountElm.send_raw_lines(elm, cmd, timeout)
+
+        elm.send_raw_lines = send_raw_lines
+        self._query(elm)
+        self.assertTrue(probe_ok("0100", self._query(elm)))
+        self.assertNotIn("0100", elm.sent)
+        self.assertEqual(elm.sent[-1], "0100 1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import unittest
+
+from obd.pids.decode import decode_pid_data, decode_pid_response
+from obd.pids.standard_mode01 import PIDS
+
+
+class PidDecodeTests(unittest.TestCase):
+    def test_known_values(self) -> None:
+        self.assertEqual(decode_pid_response("05", "7B"), 83)
+        self.assertEqual(decode_pid_response("0C", "1AF8"), 1726.0)
+        self.assertAlmostEqual(decode_pid_response("04", "FF"), 100.0)
+        self.assertEqual(decode_pid_response("06", "80"), 0.0)
+        self.assertEqual(decode_pid_response("0E", "00"), -64.0)
+        self.assertEqual(decode_pid_response("1F", "0102"), 258)
+
+    def test_bytes_input(self) -> None:
+        self.assertEqual(decode_pid_response("0C", b"\x1a\xf8"), 1726.0)
+        self.assertEqual(decode_pid_response("05", b"\x7b\x00"), 83)
+        self.assertIsNone(decode_pid_response("0C", b"\x1a"))
+
+    def test_decode_pid_data_skips_lookup(self) -> None:
+        self.assertEqual(decode_pid_data(PIDS["0C"], b"\x1a\xf8"), 1726.0)
+        self.assertIsNone(decode_pid_data(PIDS["0C"], b"\x1a"))
+
+    def test_short_or_invalid_data(self) -> None:
+        self.assertIsNone(decode_pid_response("0C", "1A"))
+        self.assertIsNone(decode_pid_response("05", "ZZ"))
+        self.assertIsNone(decode_pid_response("FF", "00"))
+
+    def test_formula_matches_decode(self) -> None:
+        info = PIDS["0C"]
+        self.assertEqual(info.formula(0x1A, 0xF8), decode_pid_response("0C", "1AF8"))
+
+
+if __name__ == "__main__":
+    unittest.main()
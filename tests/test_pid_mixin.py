@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+from typing import Dict, List, Optional, Tuple
+
+from obd.obd2.base import BaseScanner
+from obd.pids.pid_mixin import PidMixin
+from obd.protocol import find_obd_response_payload, group_by_ecu, merge_payloads
+
+
+class _ScriptedScanner(BaseScanner, PidMixin):
+    def __init__(self, replies: Dict[str, List[str]], protocol: str = "ISO 15765-4 CAN (11 bit, 500 kbaud)") -> None:
+        self.replies = replies
+        self.commands: List[str] = []
+        self._session_info = {"protocol": protocol}
+        self._multi_pid_unsupported = False
+        # Supported-PID bitmaps are not scripted here: nothing gets pruned
+        self._supported_pids = frozenset()
+
+    def _obd_query_merged(self, command: str) -> Dict[str, List[str]]:
+        self.commands.append(command)
+        return merge_payloads(group_by_ecu(self.replies.get(command, ["NO DATA"])))
+
+    def _obd_query_payload(self, command: str, expected_prefix: List[str]) -> Optional[Tuple[str, List[str]]]:
+        return find_obd_response_payload(self._obd_query_merged(command), expected_prefix)
+
+
+class PidMixinTests(unittest.TestCase):
+    def test_read_live_data_batches_pids_into_one_request(self) -> None:
+        scanner = _ScriptedScanner({"010C0D": ["7E8 06 41 0C 1A F8 0D 32"]})
+        readings = scanner.read_live_data(["0C", "0D"])
+
+        self.assertEqual(scanner.commands, ["010C0D"])
+        self.assertEqual(list(readings), ["0C", "0D"])
+        self.assertEqual(readings["0C"].value, 1726.0)
+        self.assertEqual(readings["0D"].value, 50.0)
+
+    def test_read_live_data_falls_back_to_single_pid_requests(self) -> None:
+        scanner = _ScriptedScanner(
+            {
+                "010C0D": ["7E8 04 41 0C 1A F8"],
+                "010D": ["7E8 03 41 0D 32"],
+                "0105": ["7E8 03 41 05 7B"],
+            }
+        )
+        readings = scanner.read_live_data(["0C", "0D"])
+        self.assertEqual(readings["0D"].value, 50.0)
+        self.assertEqual(scanner.commands, ["010C0D", "010D"])
+
+        # No request answered more than one PID: batching stays off afterwards
+        scanner.commands.clear()
+        scanner.read_live_data(["05", "0D"])
+        self.assertEqual(scanner.commands, ["0105", "010D"])
+
+    def test_unanswered_batch_does_not_disable_multi_pid(self) -> None:
+        scanner = _ScriptedScanner({})
+        # Bus still waking up: nothing answers, not even the batched request
+        self.assertEqual(scanner.read_live_data(["0C", "0D"]), {})
+        self.assertEqual(scanner.commands, ["010C0D", "010C", "010D"])
+
+        scanner.replies["010C0D"] = ["7E8 06 41 0C 1A F8 0D 32"]
+        scanner.commands.clear()
+        self.assertEqual(list(scanner.read_live_data(["0C", "0D"])), ["0C", "0D"])
+        self.assertEqual(scanner.commands, ["010C0D"])
+
+    def test_ignored_batch_with_answered_single_pids_disables_multi_pid(self) -> None:
+        scanner = _ScriptedScanner({"010C": ["7E8 04 41 0C 1A F8"], "010D": ["7E8 03 41 0D 32"]})
+        # Every multi-PID request gets NO DATA, single PIDs answer
+        self.assertEqual(list(scanner.read_live_data(["0C", "0D"])), ["0C", "0D"])
+        self.assertEqual(scanner.commands, ["010C0D", "010C", "010D"])
+
+        scanner.commands.clear()
+        self.assertEqual(list(scanner.read_live_data(["0C", "0D"])), ["0C", "0D"])
+        self.assertEqual(scanner.commands, ["010C", "010D"])
+
+    def test_non_can_session_never_batches(self) -> None:
+        scanner = _ScriptedScanner(
+            {"010C": ["7E8 04 41 0C 1A F8"], "010D": ["7E8 03 41 0D 32"]}, protocol="ISO 9141-2"
+        )
+        self.assertEqual(list(scanner.read_live_data(["0C", "0D"])), ["0C", "0D"])
+        self.assertEqual(scanner.commands, ["010C", "010D"])
+
+    def test_read_live_data_stream_is_lazy(self) -> None:
+        scanner = _ScriptedScanner({"0105": ["7E8 03 41 05 7B"], "010D": ["7E8 03 41 0D 32"]})
+        scanner._multi_pid_unsupported = True
+
+        stream = scanner.read_live_data_stream(["05", "0D"])
+        self.assertEqual(next(stream).pid, "05")
+        # Nothing past the consumed reading has been requested yet
+        self.assertEqual(scanner.commands, ["0105"])
+        self.assertEqual([r.pid for r in stream], ["0D"])
+
+    def test_unsupported_pids_are_pruned_from_live_data(self) -> None:
+        scanner = _ScriptedScanner(
+            {
+                # 0C, 0D and 20 (next bitmap) supported; 05 and 0F not listed
+                "0100": ["7E8 06 41 00 00 18 00 01"],
+                "0120": ["7E8 06 41 20 00 00 00 00"],
+                "010C": ["7E8 04 41 0C 1A F8"],
+                "010F": ["7E8 03 41 0F 46"],
+            }
+        )
+        scanner._supported_pids = None
+        scanner._multi_pid_unsupported = True
+
+        self.assertEqual(scanner.get_supported_pids(), frozenset({"00", "0C", "0D", "20"}))
+        # Unlisted PIDs are still tried once: 0F answers, 05 does not
+        readings = scanner.read_live_data(["05", "0C", "0F"])
+        self.assertEqual(list(readings), ["0C", "0F"])
+        self.assertEqual(scanner.commands, ["0100", "0120", "0105", "010C", "010F"])
+
+        # From then on 05 is skipped without a request, 0F is kept
+        scanner.commands.clear()
+        self.assertIsNone(scanner.read_pid("05"))
+        self.assertEqual(list(scanner.read_live_data(["05", "0C", "0F"])), ["0C", "0F"])
+        self.assertEqual(scanner.commands, ["010C", "010F"])
+
+    def test_supported_pids_are_the_union_of_every_ecu(self) -> None:
+        scanner = _ScriptedScanner(
+            {
+                # Engine ECU: 0C and 20; transmission ECU: 0D only, and no 0120
+                "0100": ["7E8 06 41 00 00 10 00 01", "7E9 06 41 00 00 08 00 00"],
+                "0120": ["7E8 06 41 20 00 00 00 00"],
+            }
+        )
+        scanner._supported_pids = None
+
+        self.assertEqual(scanner.get_supported_pids(), frozenset({"00", "0C", "0D", "20"}))
+        self.assertEqual(scanner.commands, ["0100", "0120"])
+
+    def test_unanswered_bitmaps_are_read_again(self) -> None:
+        scanner = _ScriptedScanner({})
+        scanner._supported_pids = None
+        self.assertEqual(scanner.get_supported_pids(), frozenset())
+        self.assertIsNone(scanner._supported_pids)
+
+        scanner.replies["0100"] = ["7E8 06 41 00 00 18 00 00"]
+        self.assertEqual(scanner.get_supported_pids(), frozenset({"00", "0C", "0D"}))
+        self.assertEqual(scanner.commands, ["0100", "0100"])
+
+    def test_aread_live_data_yields_in_stream_order(self) -> None:
+        scanner = _ScriptedScanner({"010C0D": ["7E8 06 41 0C 1A F8 0D 32"]})
+
+        async def collect() -> List[str]:
+            return [r.pid async for r in scanner.aread_live_data(["0C", "0D"])]
+
+        self.assertEqual(asyncio.run(collect()), ["0C", "0D"])
+        self.assertEqual(scanner.commands, ["010C0D"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import unittest
+
+from obd.protocol import (
+    find_obd_response_payload,
+    group_by_ecu,
+    merge_payloads,
+    normalize_tokens,
+    parse_and_merge,
+)
+from obd.protocol.isotp import strip_isotp_pci_bytes, strip_isotp_pci_from_payload
+
+
+class NormalizeTests(unittest.TestCase):
+    def test_tokens_are_uppercase_hex_without_whitespace(self) -> None:
+        # PidMixin relies on this: it compares and joins tokens as-is
+        for line in ("7e8 06 41 0c 1a f8", " 41 0D 32\t", "0: 49 02 01", "SEARCHING..."):
+            for token in normalize_tokens(line):
+                self.assertRegex(token, r"^[0-9A-F]+$")
+        self.assertEqual(normalize_tokens("7e8 03 41 0d 32"), ["7E8", "03", "41", "0D", "32"])
+
+
+class MergeTests(unittest.TestCase):
+    def test_parse_and_merge_matches_group_then_merge(self) -> None:
+        lines = [
+            "SEARCHING...",
+            "7E8 10 14 49 02 01 57 50 30",
+            "7E9 03 41 0D 32",
+            "7E8 21 5A 5A 5A 39 39 5A 54",
+            "7E8 22 53 33 39 32 31 32 33",
+        ]
+        for headers_on in (True, False):
+            self.assertEqual(
+                parse_and_merge(lines, headers_on=headers_on),
+                merge_payloads(group_by_ecu(lines, headers_on=headers_on), headers_on=headers_on),
+            )
+
+
+class IsoTpTests(unittest.TestCase):
+    def test_single_frame_drops_pci_and_padding(self) -> None:
+        self.assertEqual(strip_isotp_pci_bytes(bytes.fromhex("04410C1AF8AAAAAA")), bytes.fromhex("410C1AF8"))
+
+    def test_multi_frame_reassembles_to_declared_length(self) -> None:
+        frames = "1014490201575030" "215A5A5A39395A54" "2253333932313233"
+        data = strip_isotp_pci_bytes(bytes.fromhex(frames))
+        self.assertEqual(len(data), 0x14)
+        self.assertEqual(data[3:].decode("ascii"), "WP0ZZZ99ZTS392123")
+
+    def test_payload_without_pci_is_kept(self) -> None:
+        self.assertEqual(strip_isotp_pci_from_payload(["49", "02", "1", "01"]), ["49", "02", "01"])
+
+
+class VinDecodeTests(unittest.TestCase):
+    def test_vin_from_multi_frame_response(self) -> None:
+        from obd.obd2.vehicle_info import VehicleInfoMixin
+
+        lines = ["7E8 10 14 49 02 01 57 50 30", "7E8 21 5A 5A 5A 39 39 5A 54", "7E8 22 53 33 39 32 31 32 33"]
+
+        class _Elm:
+            headers_on = True
+            elm_version = "ELM327 v1.5"
+
+            def get_protocol(self) -> str:
+                return "6"
+
+        class _Scanner(VehicleInfoMixin):
+            elm = _Elm()
+
+            def __init__(self) -> None:
+                self._session_info = {}
+                self.vin_queries = 0
+
+            def _check_connected(self) -> None:
+                return None
+
+            def _obd_query_message(self, command, expected_prefix):
+                self.vin_queries += 1
+                merged = {
+                    ecu: strip_isotp_pci_from_payload(payload)
+                    for ecu, payload in merge_payloads(group_by_ecu(lines)).items()
+                }
+                return find_obd_response_payload(merged, expected_prefix)
+
+            def get_mil_status(self):
+                return False, 0
+
+        scanner = _Scanner()
+        info = scanner.get_vehicle_info()
+        self.assertEqual(info["vin"], "WP0ZZZ99ZTS392123")
+
+        # VIN and protocol are cached for the rest of the session
+        self.assertEqual(scanner.get_vehicle_info(), info)
+        self.assertEqual(scanner.vin_queries, 1)
+
+        # Last consecutive frame lost: no VIN, and nothing cached
+        lines = lines[:2]
+        scanner = _Scanner()
+        self.assertNotIn("vin", scanner.get_vehicle_info())
+        self.assertNotIn("vin", scanner.get_vehicle_info())
+        self.assertEqual(scanner.vin_queries, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import csv
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from obd.logger import SessionLogger
+from obd.obd2.models import SensorReading
+
+
+def _reading(name: str, value: float, unit: str, pid: str) -> SensorReading:
+    return SensorReading(name=name, value=value, unit=unit, pid=pid, raw_hex="")
+
+
+class SessionLoggerTests(unittest.TestCase):
+    def test_csv_session_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="session_logger_") as tmp_dir:
+            logger = SessionLogger(tmp_dir)
+            path = logger.start_session(format="csv", filename="t", flush_interval=2)
+            for rpm in (800.0, 900.0, 1000.0):
+                logger.log_readings({"0C": _reading("Engine RPM", rpm, "rpm", "0C")})
+            summary = logger.end_session()
+
+            self.assertEqual(summary["reading_count"], 3)
+            with open(path, newline="", encoding="utf-8") as f:
+                rows = list(csv.DictReader(f))
+            self.assertEqual([r["rpm"] for r in rows], ["800.0", "900.0", "1000.0"])
+            self.assertEqual(rows[0]["rpm_unit"], "rpm")
+
+    def test_csv_rows_survive_exit_without_end_session(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="session_logger_") as tmp_dir:
+            with self.assertRaises(RuntimeError):
+                with SessionLogger(tmp_dir) as logger:
+                    path = logger.start_session(format="csv", filename="t")
+                    for rpm in (800.0, 900.0):
+                        logger.log_readings({"0C": _reading("Engine RPM", rpm, "rpm", "0C")})
+                    raise RuntimeError("monitoring aborted")
+
+            self.assertFalse(logger.is_active)
+            with open(path, newline="", encoding="utf-8") as f:
+                rows = list(csv.DictReader(f))
+            self.assertEqual([r["rpm"] for r in rows], ["800.0", "900.0"])
+
+    def test_csv_rows_reach_disk_after_flush_interval(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="session_logger_") as tmp_dir:
+            logger = SessionLogger(tmp_dir)
+            path = logger.start_session(format="csv", filename="t", flush_interval_s=0.0)
+            logger.log_readings({"0C": _reading("Engine RPM", 800.0, "rpm", "0C")})
+
+            # Session still open: the row is already in the file
+            with open(path, newline="", encoding="utf-8") as f:
+                rows = list(csv.DictReader(f))
+            self.assertEqual([r["rpm"] for r in rows], ["800.0"])
+            logger.end_session()
+
+    def test_csv_new_columns_extend_header(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="session_logger_") as tmp_dir:
+            logger = SessionLogger(tmp_dir)
+            path = logger.start_session(format="csv", filename="t")
+            logger.log_readings({"0C": _reading("Engine RPM", 800.0, "rpm", "0C")})
+            for speed in (10.0, 12.0):
+                logger.log_readings(
+                    {
+                        "0C": _reading("Engine RPM", 900.0, "rpm", "0C"),
+                        "0D": _reading("Vehicle Speed", speed, "km/h", "0D"),
+                    }
+                )
+            logger.end_session()
+
+            with open(path, newline="", encoding="utf-8") as f:
+                rows = list(csv.DictReader(f))
+            self.assertEqual(len(rows), 3)
+            self.assertEqual(rows[0]["speed"], "")
+            self.assertEqual([r["speed"] for r in rows[1:]], ["10.0", "12.0"])
+            self.assertEqual(rows[2]["speed_unit"], "km/h")
+
+    def test_csv_tuple_rows_after_event_columns(self) -> None:
+        rpm = {"0C": _reading("Engine RPM", 800.0, "rpm", "0C")}
+        with tempfile.TemporaryDirectory(prefix="session_logger_") as tmp_dir:
+            # Readings first (leading columns), then an event adds columns
+            logger = SessionLogger(tmp_dir)
+            path = logger.start_session(format="csv", filename="lead")
+            logger.log_readings(rpm)
+            logger.log_event("NOTE", "hello")
+            logger.log_readings(rpm)
+            self.assertEqual(logger._live_pids, ("0C",))
+            logger.log_readings(rpm)
+            logger.end_session()
+            with open(path, newline="", encoding="utf-8") as f:
+                rows = list(csv.reader(f))
+            self.assertEqual(rows[0], ["timestamp", "rpm", "rpm_unit", "type", "message"])
+            self.assertEqual([row[1:] for row in rows[3:]], [["800.0", "rpm", "", ""]] * 2)
+
+            # Event first: the reading columns come after the event ones
+            logger = SessionLogger(tmp_dir)
+            path = logger.start_session(format="csv", filename="trail")
+            logger.log_event("NOTE", "hello")
+            logger.log_readings(rpm)
+            logger.log_readings(rpm)
+            self.assertEqual(logger._live_pids, ("0C",))
+            logger.end_session()
+            with open(path, newline="", encoding="utf-8") as f:
+                rows = list(csv.reader(f))
+            self.assertEqual(rows[0], ["timestamp", "type", "message", "rpm", "rpm_unit"])
+            self.assertEqual([row[1:] for row in rows[2:]], [["", "", "800.0", "rpm"]] * 2)
+
+    def test_csv_quotes_cells_with_commas(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="session_logger_") as tmp_dir:
+            logger = SessionLogger(tmp_dir)
+            path = logger.start_session(format="csv", filename="t")
+            logger.log_event("NOTE", "plain", {"description": ""})
+            logger.log_event("NOTE", 'rich, "quoted"', {"description": "a\nb"})
+            logger.log_event("NOTE", "after", {"description": None})
+            logger.end_session()
+
+            with open(path, newline="", encoding="utf-8") as f:
+                rows = list(csv.DictReader(f))
+            self.assertEqual([r["message"] for r in rows], ["plain", 'rich, "quoted"', "after"])
+            self.assertEqual(rows[1]["description"], "a\nb")
+            self.assertEqual(rows[2]["description"], "")
+
+    def test_json_session_streams_ndjson_rows(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="session_logger_") as tmp_dir:
+            logger = SessionLogger(tmp_dir)
+            path = logger.start_session(format="json", filename="t")
+            logger.log_readings({"05": _reading("Engine Coolant Temperature", 90.0, "°C", "05")})
+            logger.log_event("NOTE", "hello")
+            logger.end_session()
+
+            rows = [json.loads(ln) for ln in Path(path).read_text(encoding="utf-8").splitlines()]
+            self.assertEqual(rows[0]["coolant"], 90.0)
+            self.assertEqual(rows[0]["coolant_unit"], "°C")
+            self.assertEqual(rows[1]["message"], "hello")
+
+            meta = json.loads(Path(path).with_suffix(".meta.json").read_text(encoding="utf-8"))
+            self.assertEqual(meta["reading_count"], 1)
+            self.assertEqual(logger.list_sessions(), [Path(path)])
+
+if __name__ == "__main__":
+    unittest.main()